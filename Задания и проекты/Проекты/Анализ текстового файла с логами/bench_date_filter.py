@@ -0,0 +1,133 @@
+"""
+Выборка запросов за день: разбор времени и поиск строк нужного дня.
+
+Первая таблица - скорость разбора времени из лога: datetime.strptime против parse_timestamp и hour_key.
+Вторая - запрос за день по созданному для замера логу: просмотр всего файла против индекса часов
+(построение индекса при первом запросе и повторный запрос с готовым индексом). С --sorted строки лога
+упорядочены по времени, как в настоящем логе сервера, тогда на каждый час в индексе приходится один диапазон байтов.
+Без --sorted строки перемешаны, диапазоны в индекс не сохраняются, и запрос по индексу просматривает весь файл.
+Перед замером проверяется, что запрос по индексу и просмотр всего файла находят одни и те же запросы,
+в том числе в строках с неправильным временем (см. ODD_TIMESTAMPS).
+Запуск: python bench_date_filter.py [--lines 1000000] [--sorted]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, datetime
+from itertools import cycle, islice
+from pathlib import Path
+
+from bench_workers import make_synthetic_log
+from log_index import HourIndex, hour_key, parse_timestamp
+from main import DEFAULT_LOG_PATH, LogAnalyzer, analyze_day, analyze_file
+
+TIMESTAMPS = 10 ** 5
+QUERY_DAY = date(2024, 8, 13)
+STRPTIME_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+ODD_TIMESTAMPS = [
+    "13/Aug/2024:12:53:01 +0000",
+    "13/Aug/2024:12:53:01",  # Без часового пояса
+    "13/Aug/2024:12",
+    "13/Aug/2024",  # Нет часа
+    "13/Aug/2024:xx:53:01 +0000",
+    "13/Aug/2024:1:53:01 +0000",
+    "13/Aug/2024:+1:53:01 +0000",
+    "13/Aug/2024: 1:53:01 +0000",
+    "13/Aug/2024:١٢:53:01 +0000",  # Цифры не из ASCII
+    "13/Aug/2024:12:53:٠١ +0000",
+    "13/Aug/20245:12:53:01 +0000",
+    "13/Aug/2024:12:53:01\xa0+0000",  # Неразрывный пробел
+    "13/aug/2024:12:53:01 +0000",
+    "+3/Aug/2024:12:53:01 +0000",
+]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def sort_by_time(path: Path) -> None:
+    """Упорядочивает строки файла по времени запроса."""
+    with open(path, encoding="utf-8") as fp:
+        lines = fp.readlines()
+    lines.sort(key=lambda line: parse_timestamp(line.split(None, 4)[3][1:]))
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.writelines(lines)
+
+
+def day_summary(analyzer: LogAnalyzer) -> tuple:
+    """Счётчики запросов за день. Строки в неизвестном формате не входят: по индексу читаются только строки дня."""
+    return analyzer.total, analyzer.bytes_sent, analyzer.status_counts, analyzer.ip_counts, analyzer.page_counts
+
+
+def check_same_requests(path: Path) -> None:
+    """
+    Записывает в path строки logs.txt по порядку времени и строки с временем из ODD_TIMESTAMPS,
+    затем проверяет, что запрос по индексу и просмотр всего файла (текстом и через mmap) находят одни и те же запросы.
+    """
+    make_synthetic_log(path, 1000)
+    sort_by_time(path)
+    with open(path, "a", encoding="utf-8") as fp:
+        for number, timestamp in enumerate(ODD_TIMESTAMPS):
+            fp.write(f'10.0.0.{number} - - [{timestamp}] "GET /odd/{number} HTTP/1.1" 200 {number}\n')
+
+    scan = analyze_file(path, day=QUERY_DAY)
+    mapped = analyze_file(path, use_mmap=True, day=QUERY_DAY)
+    indexed = analyze_day(path, QUERY_DAY)
+    if HourIndex.load(path).ranges is None:
+        raise AssertionError("Индекс упорядоченного лога построен без диапазонов")
+    if not day_summary(scan) == day_summary(mapped) == day_summary(indexed):
+        raise AssertionError("Запрос по индексу и просмотр всего файла нашли разные запросы")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер выборки запросов за день")
+    parser.add_argument("--lines", type=int, default=10 ** 6, help="Число строк в созданном файле")
+    parser.add_argument("--sorted", action="store_true", help="Упорядочить строки лога по времени")
+    args = parser.parse_args()
+
+    with open(DEFAULT_LOG_PATH, encoding="utf-8") as fp:
+        sample = [" ".join(line.split()[3:5])[1:-1] for line in fp]  # 13/Aug/2024:12:53:01 +0000
+    timestamps = list(islice(cycle(sample), TIMESTAMPS))
+
+    results = {
+        "datetime.strptime": timed(lambda: [datetime.strptime(text, STRPTIME_FORMAT) for text in timestamps])[1],
+        "parse_timestamp": timed(lambda: [parse_timestamp(text) for text in timestamps])[1],
+        "hour_key": timed(lambda: [hour_key(text) for text in timestamps])[1],
+    }
+    baseline = results["datetime.strptime"]
+    print(f"Разбор {TIMESTAMPS:,} значений времени:")
+    for name, elapsed in results.items():
+        print(f"{name:>18}: {elapsed:.3f} с ({baseline / elapsed:.1f}x)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        check_same_requests(Path(directory) / "check.txt")
+
+        path = Path(directory) / "logs.txt"
+        make_synthetic_log(path, args.lines)
+        if args.sorted:
+            sort_by_time(path)
+        print(f"\nЗапрос за {QUERY_DAY}, строк: {args.lines:,}, "
+              f"размер файла: {os.path.getsize(path) / 2 ** 20:.1f} МиБ")
+
+        scan, scan_time = timed(lambda: analyze_file(path, day=QUERY_DAY))
+        first, first_time = timed(lambda: analyze_day(path, QUERY_DAY))
+        again, again_time = timed(lambda: analyze_day(path, QUERY_DAY))
+        if not day_summary(scan) == day_summary(first) == day_summary(again):
+            raise AssertionError("Запрос по индексу и просмотр всего файла нашли разные запросы")
+
+        index = HourIndex.load(path)
+        index_size = os.path.getsize(HourIndex.index_path(path)) / 2 ** 20
+        if index.ranges is None:
+            print(f"Найдено запросов: {scan.total:,}, лог не упорядочен по времени, индекс без диапазонов "
+                  f"({index_size:.1f} МиБ), запрос просматривает весь файл")
+        else:
+            ranges = sum(len(hour_ranges) for hour_ranges in index.ranges.values())
+            print(f"Найдено запросов: {scan.total:,}, часов в индексе: {len(index.keys)}, диапазонов: {ranges:,}, "
+                  f"размер индекса: {index_size:.1f} МиБ")
+        print(f"{'просмотр всего файла':>32}: {scan_time:.3f} с")
+        print(f"{'построение индекса и запрос':>32}: {first_time:.3f} с")
+        print(f"{'запрос по готовому индексу':>32}: {again_time:.3f} с ({scan_time / again_time:.1f}x)")
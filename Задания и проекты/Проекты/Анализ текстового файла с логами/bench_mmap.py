@@ -0,0 +1,111 @@
+"""
+Чтение лога в текстовом режиме против разбора bytes через mmap: время и пиковая память процесса (RSS).
+
+Каждый режим запускается в отдельном процессе, иначе пик памяти одного режима скрыл бы пик другого.
+В строке «без разбора» - память процесса после импорта модулей, её нужно вычесть из остальных.
+Прочитанные страницы файла, отображённого через mmap, тоже попадают в RSS. process_mmap отдаёт их системе
+каждые MMAP_RELEASE_SIZE байтов, поэтому RSS режима mmap больше текстового не более чем на это окно
+и не растёт с размером файла.
+В конец файла дописываются строки в необычном и неправильном формате, и отчёты обоих режимов сравниваются:
+быстрый разбор bytes в mmap и разбор str в текстовом режиме должны принимать и отбрасывать одни и те же строки.
+Модуль resource есть только в Unix.
+Запуск: python bench_mmap.py [--lines 1000000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_workers import make_synthetic_log
+from main import LogAnalyzer, analyze_file
+
+MODES = {"без разбора": None, "текстовый режим": False, "mmap": True}
+
+VALID_LINE = '1.2.3.4 - - [13/Aug/2024:12:53:01 +0000] "GET /a HTTP/1.1" 200 5'
+ODD_LINES = [
+    '1.2.3.4 - - [13/Aug/2024:12:53:01 +0000] "GET /" 200 -',  # Нет протокола, размер "-"
+    VALID_LINE + ' "http://example.com/" "Mozilla/5.0 (X11)"',  # Combined Log Format
+    VALID_LINE.replace(" ", "  "),  # Поля разделены несколькими пробелами
+    VALID_LINE.replace(" 200 ", "\t200\t"),
+    VALID_LINE.replace(" 200 ", "\xa0200 "),  # Неразрывный пробел: str.split делит по нему, bytes.split - нет
+    VALID_LINE.replace("/a", "/путь"),
+    VALID_LINE.replace("/a", "/a b"),  # Пробел в пути
+    VALID_LINE.replace(" 200 ", " ٢٠٠ "),  # Цифры не из ASCII
+    VALID_LINE.replace(" 200 ", " -12 "),
+    VALID_LINE.replace(" 200 ", " 2000 "),
+    VALID_LINE.replace(" 5", " +5"),
+    VALID_LINE.replace(" 5", " 1_0"),
+    VALID_LINE + "\r",
+    "garbage",
+    "",
+    "   ",
+    VALID_LINE.replace(" 200 ", " 404 "),  # Последняя строка без перевода строки
+]
+
+
+def add_odd_lines(path: Path) -> None:
+    """Дописывает в конец файла строки из ODD_LINES."""
+    with open(path, "a", encoding="utf-8", newline="") as fp:
+        fp.write("\n".join(ODD_LINES))
+
+
+def summary(analyzer: LogAnalyzer) -> dict:
+    """Все собранные счётчики, по ним сравниваются отчёты разных режимов."""
+    return {
+        "total": analyzer.total,
+        "malformed": analyzer.malformed,
+        "bytes_sent": analyzer.bytes_sent,
+        "status_counts": sorted(analyzer.status_counts.items()),
+        "ip_counts": sorted(analyzer.ip_counts.items()),
+        "page_counts": sorted(analyzer.page_counts.items()),
+    }
+
+
+def run_mode(path: Path, use_mmap: bool) -> dict:
+    """Разбирает файл в текущем процессе и возвращает время, пиковый RSS в МиБ и счётчики отчёта."""
+    elapsed = 0.0
+    result = None
+    if use_mmap is not None:
+        start = time.perf_counter()
+        result = summary(analyze_file(path, 1, use_mmap))
+        elapsed = time.perf_counter() - start
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # В Linux ru_maxrss в КиБ
+    return {"elapsed": elapsed, "max_rss": max_rss, "summary": result}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение текстового режима и mmap")
+    parser.add_argument("--lines", type=int, default=10 ** 6, help="Число строк в созданном файле")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, path = args.child
+        print(json.dumps(run_mode(Path(path), MODES[mode])))
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "logs.txt"
+        make_synthetic_log(path, args.lines)
+        add_odd_lines(path)
+        print(f"Строк: {args.lines:,}, размер файла: {os.path.getsize(path) / 2 ** 20:.1f} МиБ")
+
+        print(f"{'режим':>15} {'время, с':>9} {'строк/с':>12} {'пиковый RSS, МиБ':>17}")
+        summaries = {}
+        for mode in MODES:
+            output = subprocess.run([sys.executable, __file__, "--child", mode, str(path)],
+                                    capture_output=True, text=True, check=True).stdout
+            result = json.loads(output)
+            summaries[mode] = result["summary"]
+            speed = f"{args.lines / result['elapsed']:,.0f}" if result["elapsed"] else "-"
+            print(f"{mode:>15} {result['elapsed']:>9.2f} {speed:>12} {result['max_rss']:>17.1f}")
+
+        if summaries["текстовый режим"] != summaries["mmap"]:
+            raise AssertionError("Отчёты текстового режима и mmap различаются")
+        print(f"Отчёты совпадают: запросов {summaries['mmap']['total']:,}, "
+              f"строк в неизвестном формате {summaries['mmap']['malformed']}")
@@ -0,0 +1,57 @@
+"""
+Скорость разбора строк лога: простой вызов re.match на каждую строку против LogLineParser.
+
+Строки logs.txt повторяются по кругу до нужного числа, поэтому файл размером в гигабайты создавать не нужно.
+Замеряется только разбор, чтение файла и подсчёт статистики в замер не входят.
+Запуск: python bench_parser.py [--lines 10000000]
+"""
+import argparse
+import re
+import time
+from itertools import cycle, islice
+from typing import Callable, Optional
+
+from main import DEFAULT_LOG_PATH, LogLineParser
+
+NAIVE_PATTERN = r'(?P<ip>\S+) \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>\S+) (?P<path>\S+) [^"]*" (?P<status>\d{3}) (?P<size>\d+|-)'
+
+
+def naive_parse(line: str) -> Optional[dict]:
+    """Разбор «в лоб»: шаблон передаётся строкой, re.match каждый раз ищет его в кэше скомпилированных шаблонов."""
+    match = re.match(NAIVE_PATTERN, line)
+    if match is None:
+        return None
+    record = match.groupdict()
+    record["status"] = int(record["status"])
+    record["size"] = 0 if record["size"] == "-" else int(record["size"])
+    return record
+
+
+def measure(parse: Callable[[str], object], lines: list[str], count: int, repeat: int = 3) -> float:
+    """Возвращает число строк в секунду при разборе count строк, лучший результат из repeat запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in islice(cycle(lines), count):
+            parse(line)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение способов разбора строк лога")
+    parser.add_argument("--lines", type=int, default=10 ** 6, help="Сколько строк разобрать")
+    args = parser.parse_args()
+
+    with open(DEFAULT_LOG_PATH, encoding="utf-8") as fp:
+        sample = fp.readlines()
+
+    results = {
+        "re.match на каждую строку": measure(naive_parse, sample, args.lines),
+        "скомпилированный шаблон": measure(LogLineParser().parse_slow, sample, args.lines),
+        "LogLineParser (str.split)": measure(LogLineParser().parse, sample, args.lines),
+    }
+    baseline = results["re.match на каждую строку"]
+    print(f"Разобрано строк: {args.lines:,}")
+    for name, lines_per_second in results.items():
+        print(f"{name:>32}: {lines_per_second:>12,.0f} строк/с ({lines_per_second / baseline:.2f}x)")
@@ -0,0 +1,51 @@
+"""
+Масштабирование разбора логов по процессам: analyze_file с 1, 2, 4 и 8 процессами.
+
+Для замера создаётся временный файл, в котором строки logs.txt повторяются до нужного числа строк.
+Ускорение ограничено числом ядер процессора (os.cpu_count()) и скоростью диска,
+а на маленьких файлах время запуска процессов больше, чем выигрыш от них.
+Запуск: python bench_workers.py [--lines 1000000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+from itertools import cycle, islice
+from pathlib import Path
+
+from main import DEFAULT_LOG_PATH, analyze_file
+
+
+def make_synthetic_log(path: Path, count: int) -> None:
+    """Записывает в path count строк, повторяя строки logs.txt по кругу."""
+    with open(DEFAULT_LOG_PATH, encoding="utf-8") as fp:
+        sample = [line.rstrip("\n") + "\n" for line in fp]
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.writelines(islice(cycle(sample), count))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Замер разбора логов в нескольких процессах")
+    parser.add_argument("--lines", type=int, default=10 ** 6, help="Число строк в созданном файле")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Числа процессов для замера")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "logs.txt"
+        make_synthetic_log(path, args.lines)
+        print(f"Строк: {args.lines:,}, размер файла: {os.path.getsize(path) / 2 ** 20:.1f} МиБ, "
+              f"ядер: {os.cpu_count()}")
+
+        print(f"{'процессов':>9} {'время, с':>9} {'строк/с':>12} {'ускорение':>9}")
+        baseline = expected = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            analyzer = analyze_file(path, workers)
+            elapsed = time.perf_counter() - start
+
+            report = analyzer.report().rsplit("\n", 1)[0]  # Без последней строки со скоростью
+            if expected is None:
+                baseline, expected = elapsed, report
+            elif report != expected:
+                raise AssertionError(f"Отчёт при {workers} процессах отличается от отчёта при {args.workers[0]}")
+            print(f"{workers:>9} {elapsed:>9.2f} {args.lines / elapsed:>12,.0f} {baseline / elapsed:>9.2f}")
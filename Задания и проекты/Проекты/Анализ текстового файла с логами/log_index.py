@@ -0,0 +1,188 @@
+"""
+Разбор времени из лога и индекс строк по часам для выборки запросов за день.
+
+Индекс хранится рядом с логом в файле <имя лога>.idx. Для каждого часа в нём записаны диапазоны байтов,
+в которых лежат строки этого часа. Если лог записан по порядку времени, на час приходится один диапазон,
+а в перемешанном логе - по диапазону на каждую серию соседних строк одного часа. Запрос за день читает
+только эти диапазоны, а не весь файл. Индекс строится один раз и перестраивается, только когда лог изменился.
+Если лог сильно перемешан, диапазонов становится почти столько же, сколько строк: индекс растёт вместе с логом,
+а запрос читает файл по строке за раз. Тогда диапазоны не сохраняются, и запрос за день просматривает весь файл.
+"""
+import json
+import os
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+MONTHS = {name: number for number, name in enumerate(MONTH_NAMES, start=1)}
+MAX_RANGES_PER_HOUR = 8  # Больше диапазонов в среднем на час - лог не упорядочен по времени, индекс не нужен
+
+
+@lru_cache(maxsize=None)
+def parse_zone(zone: str) -> timezone:
+    """Часовой пояс вида +0300. В логе их обычно один-два, поэтому объекты timezone кэшируются."""
+    offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[3:5]))
+    return timezone(-offset if zone[0] == "-" else offset)
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Разбирает время из лога, например 13/Aug/2024:12:53:01 или 13/Aug/2024:12:53:01 +0000.
+    Поля стоят на одних и тех же позициях, поэтому достаточно срезов и таблицы месяцев.
+    Это в несколько раз быстрее datetime.strptime, который на каждый вызов разбирает строку формата.
+    :raises ValueError, KeyError: Если строка не в формате лога
+    """
+    zone = parse_zone(timestamp[21:26]) if len(timestamp) > 20 else None
+    return datetime(int(timestamp[7:11]), MONTHS[timestamp[3:6]], int(timestamp[0:2]),
+                    int(timestamp[12:14]), int(timestamp[15:17]), int(timestamp[18:20]), tzinfo=zone)
+
+
+def is_log_hour(timestamp: str) -> bool:
+    """
+    Проверяет, что время начинается с даты и часа в формате лога, например 13/Aug/2024:12, с цифрами ASCII.
+    По этому правилу строки за день отбираются и в индексе, и при просмотре всего файла, поэтому оба способа
+    находят одни и те же строки. Проверка по символам, а не через int(): int() принял бы и " 3", "+3", "1_3".
+    """
+    return (len(timestamp) >= 14 and timestamp[:14].isascii()
+            and timestamp[2] == "/" and timestamp[6] == "/" and timestamp[11] == ":"
+            and (timestamp[0:2] + timestamp[7:11] + timestamp[12:14]).isdigit() and timestamp[3:6] in MONTHS)
+
+
+def hour_key(timestamp: str) -> int:
+    """
+    Номер часа вида 2024081312 (год, месяц, день, час) без создания datetime. Часовой пояс не учитывается.
+    :raises ValueError: Если время не начинается с даты и часа в формате лога (см. is_log_hour)
+    """
+    if not is_log_hour(timestamp):
+        raise ValueError(f"Время не в формате лога: {timestamp!r}")
+    return (int(timestamp[7:11]) * 1000000 + MONTHS[timestamp[3:6]] * 10000
+            + int(timestamp[0:2]) * 100 + int(timestamp[12:14]))
+
+
+def day_key(day: date) -> int:
+    """Номер дня вида 20240813, номера всех часов этого дня - от day_key * 100 до day_key * 100 + 23."""
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def log_date_prefix(day: date) -> str:
+    """Дата в формате лога, например 13/Aug/2024. Время строки за этот день начинается с неё."""
+    return f"{day.day:02}/{MONTH_NAMES[day.month - 1]}/{day.year}"
+
+
+class HourIndex:
+    """
+    Индекс строк лога по часам: номер часа -> список диапазонов байтов [начало, конец).
+    ranges равен None, если лог не упорядочен по времени и диапазонов получилось слишком много.
+    """
+
+    def __init__(self, size: int, mtime_ns: int, ranges: Optional[dict[int, list[list[int]]]]):
+        self.size = size  # Размер и время изменения лога, по ним видно, что индекс устарел
+        self.mtime_ns = mtime_ns
+        self.ranges = ranges
+        self.keys = [] if ranges is None else sorted(ranges)
+
+    @staticmethod
+    def index_path(log_path: Path) -> Path:
+        return log_path.with_name(log_path.name + ".idx")
+
+    @classmethod
+    def build(cls, log_path: Path) -> 'HourIndex':
+        """
+        Строит индекс за один проход по файлу. Строки без времени в формате лога в индекс не попадают.
+        Если диапазонов в среднем больше MAX_RANGES_PER_HOUR на час, построение прекращается и диапазоны
+        не сохраняются. Проверка идёт по ходу чтения, поэтому перемешанный лог не занимает память под диапазоны.
+        """
+        stat = os.stat(log_path)
+        ranges: dict[int, list[list[int]]] = {}
+        range_count = 0
+        last_range = None  # Диапазон предыдущей строки, его можно продлить, если следующая строка того же часа
+        last_key = None
+        position = 0
+        with open(log_path, "rb") as fp:
+            for line in fp:
+                start = position
+                position += len(line)
+                # Строка делится как str, как в LogLineParser: str.split, в отличие от bytes.split,
+                # делит и по пробельным символам Unicode. Время - четвёртое поле, дальше строку делить не нужно
+                fields = line.decode("utf-8", "replace").split(None, 4)
+                try:
+                    key = hour_key(fields[3][1:])
+                except (IndexError, ValueError):
+                    last_key = None
+                    continue
+
+                if key == last_key:
+                    last_range[1] = position
+                else:
+                    last_range = [start, position]
+                    ranges.setdefault(key, []).append(last_range)
+                    last_key = key
+                    range_count += 1
+                    if range_count > MAX_RANGES_PER_HOUR * (len(ranges) + 24):  # 24 - запас на первые часы лога
+                        return cls(stat.st_size, stat.st_mtime_ns, None)
+        return cls(stat.st_size, stat.st_mtime_ns, ranges)
+
+    @classmethod
+    def load(cls, log_path: Path) -> Optional['HourIndex']:
+        """
+        Загружает индекс из файла рядом с логом.
+        Возвращает None, если индекса нет, он повреждён или лог с тех пор изменился.
+        """
+        try:
+            with open(cls.index_path(log_path), encoding="utf-8") as fp:
+                data = json.load(fp)
+            stat = os.stat(log_path)
+            if data["size"] != stat.st_size or data["mtime_ns"] != stat.st_mtime_ns:
+                return None
+            ranges = data["ranges"]
+            if ranges is not None:
+                ranges = {int(key): [[int(start), int(end)] for start, end in value] for key, value in ranges.items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):  # Индекса нет или он повреждён
+            return None
+        return cls(data["size"], data["mtime_ns"], ranges)
+
+    def save(self, log_path: Path) -> None:
+        with open(self.index_path(log_path), "w", encoding="utf-8") as fp:
+            json.dump({"size": self.size, "mtime_ns": self.mtime_ns, "ranges": self.ranges}, fp)
+
+    def ranges_for_day(self, day: date) -> Optional[list[tuple[int, int]]]:
+        """
+        Диапазоны байтов со строками за день по возрастанию. Часы дня находятся двоичным поиском
+        по отсортированным номерам часов, соседние диапазоны склеиваются, чтобы читать их одним куском.
+        Возвращает None, если лог не упорядочен по времени и нужно просмотреть весь файл.
+        """
+        if self.ranges is None:
+            return None
+        first_hour = day_key(day) * 100
+        keys = self.keys[bisect_left(self.keys, first_hour):bisect_left(self.keys, first_hour + 100)]
+
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(byte_range for key in keys for byte_range in self.ranges[key]):
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+
+def load_or_build_index(log_path: Path) -> HourIndex:
+    """
+    Загружает индекс лога, а если его нет или он устарел, строит заново и сохраняет рядом с логом.
+    Если сохранить индекс не удалось, например каталог лога только для чтения, используется построенный в памяти.
+    """
+    index = HourIndex.load(log_path)
+    if index is None:
+        index = HourIndex.build(log_path)
+        try:
+            index.save(log_path)
+        except OSError:
+            pass  # Индекс будет построен заново при следующем запросе
+    return index
+
+
+if __name__ == "__main__":
+    print(parse_timestamp("13/Aug/2024:12:53:01 +0000"))  # 2024-08-13 12:53:01+00:00
+    print(hour_key("13/Aug/2024:12:53:01"), log_date_prefix(date(2024, 8, 13)))  # 2024081312 13/Aug/2024
@@ -1,3 +1,393 @@
+"""
+Анализ логов веб-сервера в формате:
+95.137.111.56 - - [13/Aug/2024:12:53:01 +0000] "DELETE /contact HTTP/1.1" 503 4235
+
+Файл читается построчно генератором и обрабатывается за один проход, в память целиком он не загружается.
+Память растёт только с числом разных IP-адресов, страниц и статусов, поэтому так можно разбирать логи
+размером в десятки гигабайт. С параметром --workers файл делится на части по границам строк,
+части разбираются в отдельных процессах, а их статистика складывается в основном процессе.
+С параметром --mmap файл отображается в память и разбирается как bytes, без декодирования каждой строки.
+С параметром --date учитываются только запросы за указанный день. Строки этого дня находятся по индексу
+из log_index.py, который строится при первом запросе, --no-index отключает индекс и просматривает весь файл.
+
+Запуск: python main.py [путь к файлу логов] [--workers N] [--mmap] [--date 2024-08-13 [--no-index]]
+"""
+import argparse
+import mmap
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from log_index import is_log_hour, load_or_build_index, log_date_prefix
+
+DEFAULT_LOG_PATH = Path(__file__).with_name("logs.txt")
+CHUNKS_PER_WORKER = 4  # Частей больше, чем процессов, чтобы освободившийся процесс забирал следующую часть
+MMAP_RELEASE_SIZE = 16 * 2 ** 20  # Через сколько прочитанных байтов страницы mmap отдаются системе
+LEFT_BRACKET, RIGHT_BRACKET, QUOTE = b'[]"'  # Элементы bytes - коды символов, с ними сравниваются байты строки
+
+
+class LogRecord:
+    """Разобранная строка лога. __slots__ экономят память и ускоряют создание записи на каждую строку."""
+    __slots__ = ("ip", "timestamp", "method", "path", "status", "size")
+
+    def __init__(self, ip: str, timestamp: str, method: str, path: str, status: int, size: int):
+        self.ip = ip
+        self.timestamp = timestamp  # Время как в логе без часового пояса, например 13/Aug/2024:12:53:01
+        self.method = method
+        self.path = path
+        self.status = status
+        self.size = size  # Размер ответа в байтах, 0 если в логе стоит "-"
+
+    def __repr__(self) -> str:
+        return (f"LogRecord({self.ip!r}, {self.timestamp!r}, {self.method!r}, {self.path!r}, "
+                f"{self.status}, {self.size})")
+
+
+class LogLineParser:
+    """
+    Разбор строк в формате Common/Combined Log Format.
+
+    Правильная строка делится методом str.split на поля за один вызов на C, после чего достаточно проверить
+    несколько символов-разделителей, движок регулярных выражений не запускается. Если строка не подошла
+    под быстрый разбор (например, в запросе нет протокола или в пути есть пробел), она проверяется
+    заранее скомпилированным регулярным выражением.
+    Строки, которые не подошли и под него, считаются в malformed.
+    """
+    PATTERN = re.compile(
+        r'\s*(\S+)\s+\S+\s+\S+\s+\[([^\]\s]*)[^\]]*\]\s+"(\S+)\s+(\S+)[^"]*"\s+(\d{3})\s+(\d+|-)(?:\s|$)'
+    )
+
+    def __init__(self):
+        self.parsed = 0  # Разобрано быстрым способом
+        self.fallback = 0  # Разобрано регулярным выражением
+        self.malformed = 0  # Не разобрано
+
+    def merge(self, other: 'LogLineParser') -> None:
+        """Добавляет счётчики другого разборщика."""
+        self.parsed += other.parsed
+        self.fallback += other.fallback
+        self.malformed += other.malformed
+
+    def parse(self, line: str) -> Optional[LogRecord]:
+        """Разбирает строку. Возвращает None для пустой строки и для строки в неизвестном формате."""
+        # Правильная строка делится по пробелам ровно на 10 полей (в Combined Log Format дальше идут ещё поля):
+        # IP, идентификатор, пользователь, [дата:время, зона], "метод, путь, протокол", статус, размер
+        fields = line.split()
+        # Статус и размер проверяются isdecimal, а не через int(): int() принял бы и "-12", "+12", "1_0".
+        # isdecimal пропускает те же цифры, что и \d в PATTERN, поэтому быстрый разбор и шаблон согласованы
+        if (len(fields) >= 10 and fields[3][0] == "[" and fields[4][-1] == "]"
+                and fields[5][0] == '"' and fields[7][-1] == '"'
+                and len(fields[8]) == 3 and fields[8].isdecimal()
+                and (fields[9] == "-" or fields[9].isdecimal())):
+            self.parsed += 1
+            size = fields[9]
+            return LogRecord(fields[0], fields[3][1:], fields[5][1:], fields[6],
+                             int(fields[8]), 0 if size == "-" else int(size))
+        return self.parse_slow(line)
+
+    def parse_slow(self, line: str) -> Optional[LogRecord]:
+        """Разбор регулярным выражением для строк, которые не подошли под быстрый разбор."""
+        match = self.PATTERN.match(line)
+        if match is None:
+            if line and not line.isspace():
+                self.malformed += 1  # Пустые строки ошибкой не считаются
+            return None
+
+        self.fallback += 1
+        ip, timestamp, method, path, status, size = match.groups()
+        return LogRecord(ip, timestamp, method, path, int(status), 0 if size == "-" else int(size))
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    """Генератор строк файла. Файл читается буферами, в памяти одновременно находится только одна строка."""
+    with open(path, encoding="utf-8") as fp:
+        yield from fp
+
+
+def split_file(path: Path, parts: int) -> list[tuple[int, int]]:
+    """
+    Делит файл на parts диапазонов байтов примерно одинакового размера.
+    Каждая граница сдвигается на начало следующей строки, поэтому строка целиком попадает ровно в один диапазон.
+    :return: Список пар (начало, конец), пустые диапазоны не возвращаются
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as fp:
+        for part in range(1, parts):
+            position = size * part // parts
+            if position <= bounds[-1]:
+                continue
+            fp.seek(position - 1)
+            fp.readline()  # Дочитываем строку, в которую попала граница; если перед границей \n, читается только он
+            bounds.append(fp.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def read_ranges(path: Path, ranges: Iterable[tuple[int, int]]) -> Iterator[str]:
+    """
+    Генератор строк из диапазонов байтов [start, end), каждый из которых начинается с начала строки.
+    Файл открывается один раз на все диапазоны.
+    """
+    with open(path, "rb") as fp:  # В текстовом режиме нельзя перейти к произвольному байту
+        for start, end in ranges:
+            if start >= end:
+                continue
+            fp.seek(start)
+            position = start
+            for line in fp:
+                yield line.decode("utf-8")
+                position += len(line)
+                if position >= end:
+                    break
+
+
+def analyze_range(path: Path, start: int, end: int, use_mmap: bool = False,
+                  day: Optional[date] = None) -> 'LogAnalyzer':
+    """Собирает статистику по диапазону байтов файла. Выполняется в дочернем процессе."""
+    if use_mmap:
+        return LogAnalyzer(day=day).process_mmap(path, start, end)
+    return LogAnalyzer(day=day).process_lines(read_ranges(path, [(start, end)]))
+
+
+def analyze_day(path: Path, day: date) -> 'LogAnalyzer':
+    """
+    Собирает статистику за день, читая по индексу часов только строки этого дня.
+    Индекс строится при первом вызове и сохраняется рядом с логом, следующие вызовы его переиспользуют.
+    Если лог не упорядочен по времени и индекс без диапазонов, просматривается весь файл.
+    """
+    ranges = load_or_build_index(path).ranges_for_day(day)
+    if ranges is None:
+        return analyze_file(path, day=day)
+    # Строки из диапазонов проверяются тем же правилом, что и при просмотре всего файла
+    return LogAnalyzer(day=day).process_lines(read_ranges(path, ranges))
+
+
+def analyze_file(path: Path, workers: int = 1, use_mmap: bool = False, day: Optional[date] = None) -> 'LogAnalyzer':
+    """
+    Собирает статистику по файлу. При workers > 1 части файла разбираются в пуле процессов,
+    а результаты складываются методом LogAnalyzer.merge в порядке частей, поэтому отчёт совпадает
+    с однопроцессным, включая порядок значений с одинаковым числом запросов.
+    :param day: Учитывать только запросы за этот день, остальные строки просматриваются и пропускаются
+    """
+    if workers <= 1:
+        return analyze_range(path, 0, os.path.getsize(path), use_mmap, day)
+
+    start = time.perf_counter()
+    analyzer = LogAnalyzer(day=day)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(analyze_range, path, range_start, range_end, use_mmap, day)
+                   for range_start, range_end in split_file(path, workers * CHUNKS_PER_WORKER)]
+        for future in futures:
+            analyzer.merge(future.result())
+    analyzer.elapsed = time.perf_counter() - start  # Время целиком, а не сумма времени процессов
+    return analyzer
+
+
+class LogAnalyzer:
+    """
+    Накопитель статистики по строкам лога. Каждая строка разбирается один раз и сразу учитывается
+    во всех счётчиках, поэтому для любого числа показателей достаточно одного прохода по файлу.
+    """
+
+    def __init__(self, parser: Optional[LogLineParser] = None, day: Optional[date] = None):
+        """
+        :param parser: Разборщик строк, по умолчанию новый LogLineParser
+        :param day: Учитывать только запросы за этот день
+        """
+        self.parser = LogLineParser() if parser is None else parser
+        # Дата сравнивается с началом времени в строке, например 13/Aug/2024, поэтому время строки не разбирается
+        self.date_prefix = None if day is None else log_date_prefix(day)
+        self.total = 0  # Количество разобранных запросов
+        self.skipped = 0  # Запросы за другие дни
+        self.bytes_sent = 0  # Суммарный размер ответов
+        self.status_counts = Counter()
+        self.ip_counts = Counter()
+        self.page_counts = Counter()
+        self.elapsed = 0.0  # Время обработки в секундах
+
+    def in_day(self, timestamp: str) -> bool:
+        """
+        Время относится к выбранному дню: начинается с его даты, а дальше идёт час, как требует индекс часов.
+        Сначала сравнивается начало строки, поэтому строки за другие дни дальше не проверяются.
+        """
+        return timestamp.startswith(self.date_prefix) and is_log_hour(timestamp)
+
+    def feed(self, line: str) -> None:
+        """Учитывает одну строку лога."""
+        record = self.parser.parse(line)
+        if record is None:
+            return
+        if self.date_prefix is not None and not self.in_day(record.timestamp):
+            self.skipped += 1
+            return
+
+        self.total += 1
+        self.ip_counts[record.ip] += 1
+        self.page_counts[record.path] += 1
+        self.status_counts[record.status] += 1
+        self.bytes_sent += record.size
+
+    def process_lines(self, lines: Iterable[str]) -> 'LogAnalyzer':
+        """Обрабатывает строки из любого итерируемого объекта и замеряет время обработки."""
+        start = time.perf_counter()
+        feed = self.feed
+        for line in lines:
+            feed(line)
+        self.elapsed += time.perf_counter() - start
+        return self
+
+    def process_file(self, path: Path) -> 'LogAnalyzer':
+        return self.process_lines(read_lines(path))
+
+    def process_mmap(self, path: Path, start: int = 0, end: Optional[int] = None) -> 'LogAnalyzer':
+        """
+        Обрабатывает диапазон байтов [start, end) файла, отображённого в память через mmap.
+        Строки не декодируются: поля выделяются из bytes, а IP-адреса, страницы и статусы считаются
+        по bytes-ключам. В str превращаются только ключи счётчиков в конце, по одному разу на каждое
+        разное значение. Время и другие поля, которые не нужны для статистики, не декодируются совсем.
+        Строки, не подошедшие под быстрый разбор, декодируются и разбираются регулярным выражением.
+        Прочитанные страницы файла периодически отдаются системе, поэтому память процесса не растёт с размером файла.
+        """
+        ip_counts = Counter()
+        page_counts = Counter()
+        status_counts = Counter()
+        total = bytes_sent = parsed = skipped = 0
+        date_prefix = None if self.date_prefix is None else b"[" + self.date_prefix.encode("ascii")
+        started = time.perf_counter()
+
+        with open(path, "rb") as fp:
+            if end is None:
+                end = os.fstat(fp.fileno()).st_size
+            if start < end:  # Пустой файл отобразить в память нельзя
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    can_release = hasattr(mmap, "MADV_DONTNEED")  # madvise есть не во всех системах
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)  # Система будет читать файл наперёд
+                    mapped.seek(start)
+                    released = start - start % mmap.PAGESIZE  # madvise принимает только начало страницы
+                    position = start
+                    for line in iter(mapped.readline, b""):
+                        if position >= end:
+                            break  # Строка относится к следующему диапазону
+                        position += len(line)
+                        if can_release and position - released >= MMAP_RELEASE_SIZE:
+                            # Страницы остаются в кэше файлов системы, но больше не входят в память процесса
+                            release_end = position - position % mmap.PAGESIZE
+                            mapped.madvise(mmap.MADV_DONTNEED, released, release_end - released)
+                            released = release_end
+                        fields = line.split()
+                        if (len(fields) >= 10 and fields[3][0] == LEFT_BRACKET and fields[4][-1] == RIGHT_BRACKET
+                                and fields[5][0] == QUOTE and fields[7][-1] == QUOTE
+                                and len(fields[8]) == 3 and fields[8].isdigit()
+                                and (fields[9].isdigit() or fields[9] == b"-")):
+                            parsed += 1
+                            if date_prefix is not None and not (fields[3].startswith(date_prefix)
+                                                                and is_log_hour(fields[3][1:15].decode("latin-1"))):
+                                skipped += 1
+                                continue
+                            total += 1
+                            ip_counts[fields[0]] += 1
+                            page_counts[fields[6]] += 1
+                            status_counts[fields[8]] += 1
+                            if fields[9] != b"-":
+                                bytes_sent += int(fields[9])
+                        else:
+                            record = self.parser.parse_slow(line.decode("utf-8"))
+                            if record is None:
+                                continue
+                            if self.date_prefix is not None and not self.in_day(record.timestamp):
+                                skipped += 1
+                                continue
+                            total += 1
+                            ip_counts[record.ip.encode("utf-8")] += 1
+                            page_counts[record.path.encode("utf-8")] += 1
+                            status_counts[str(record.status).encode()] += 1
+                            bytes_sent += record.size
+
+        self.total += total
+        self.skipped += skipped
+        self.bytes_sent += bytes_sent
+        self.parser.parsed += parsed
+        self.ip_counts.update({ip.decode("utf-8"): count for ip, count in ip_counts.items()})
+        self.page_counts.update({page.decode("utf-8"): count for page, count in page_counts.items()})
+        self.status_counts.update({int(status): count for status, count in status_counts.items()})
+        self.elapsed += time.perf_counter() - started
+        return self
+
+    def merge(self, other: 'LogAnalyzer') -> 'LogAnalyzer':
+        """Добавляет статистику другого анализатора, например собранную другим процессом по своей части файла."""
+        self.total += other.total
+        self.skipped += other.skipped
+        self.bytes_sent += other.bytes_sent
+        self.status_counts.update(other.status_counts)
+        self.ip_counts.update(other.ip_counts)
+        self.page_counts.update(other.page_counts)
+        self.parser.merge(other.parser)
+        return self
+
+    @property
+    def malformed(self) -> int:
+        """Строки, которые не подошли под формат лога."""
+        return self.parser.malformed
+
+    @property
+    def success_count(self) -> int:
+        """Количество успешных запросов (статус 200)."""
+        return self.status_counts[200]
+
+    def top_ips(self, count: int = 5) -> list[tuple[str, int]]:
+        return self.ip_counts.most_common(count)
+
+    def top_page(self) -> Optional[tuple[str, int]]:
+        """Самая часто запрашиваемая страница и число запросов к ней или None, если запросов не было."""
+        most_common = self.page_counts.most_common(1)
+        return most_common[0] if most_common else None
+
+    @property
+    def lines_per_second(self) -> float:
+        lines = self.total + self.skipped + self.malformed
+        return lines / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        """Текстовый отчёт по собранной статистике."""
+        lines = [
+            f"Всего запросов: {self.total}",
+            f"Успешных запросов (200): {self.success_count}",
+            "Топ-5 IP-адресов:",
+            *(f"  {ip}: {count}" for ip, count in self.top_ips(5)),
+        ]
+        top_page = self.top_page()
+        if top_page is not None:
+            lines.append(f"Самая запрашиваемая страница: {top_page[0]} ({top_page[1]} запросов)")
+        if self.malformed:
+            lines.append(f"Строк в неизвестном формате: {self.malformed}")
+        lines.append(f"Скорость обработки: {self.lines_per_second:,.0f} строк/с")
+        return "\n".join(lines)
+
+
 if __name__ == "__main__":
-    # Write your solution here
-    pass
+    parser = argparse.ArgumentParser(description="Анализ файла логов веб-сервера")
+    parser.add_argument("path", nargs="?", type=Path, default=DEFAULT_LOG_PATH, help="Файл логов")
+    parser.add_argument("--workers", type=int, default=1, help="Число процессов для разбора")
+    parser.add_argument("--mmap", action="store_true", help="Разбирать файл как bytes через mmap")
+    parser.add_argument("--date", type=date.fromisoformat, help="Учитывать только запросы за день, например 2024-08-13")
+    parser.add_argument("--no-index", action="store_true",
+                        help="Искать запросы за день просмотром всего файла, а не по индексу. "
+                             "Без этого флага --date нельзя сочетать с --workers и --mmap")
+    args = parser.parse_args()
+    if args.date is not None and not args.no_index and (args.workers != 1 or args.mmap):
+        parser.error("--workers и --mmap с --date работают только вместе с --no-index")
+
+    if args.date is not None and not args.no_index:
+        analyzer = analyze_day(args.path, args.date)  # По индексу читается мало строк, процессы не нужны
+    else:
+        analyzer = analyze_file(args.path, args.workers, args.mmap, args.date)
+    if args.date is not None:
+        print(f"Запросы за {args.date}")
+    print(analyzer.report())
@@ -0,0 +1,53 @@
+"""
+Массовые операции над числовым LinkedList: map_inplace, filter_inplace, sum и их векторные варианты на NumPy
+против создания нового списка генератором.
+
+map и filter меняют список, поэтому перед каждым замером список создаётся заново вне замера.
+Если NumPy не установлен, колонки с векторными вариантами остаются пустыми.
+Запуск: python bench_bulk_ops.py
+"""
+from loader import load_task_module, measure, measure_fresh
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def scale(value: float) -> float:
+    return value * 0.5 + 1.0
+
+
+def is_positive(value: float) -> bool:
+    return value > 0.0
+
+
+if __name__ == "__main__":
+    module = load_task_module("task5_1_LinkedList_performance")
+    LinkedList = module.LinkedList
+    has_numpy = module.numpy is not None
+
+    def cell(seconds: float) -> str:
+        return f"{seconds:.4f}" if has_numpy else "-"
+
+    print(f"{'n':>8} {'операция':>8} {'новый список, с':>16} {'на месте, с':>12} {'NumPy, с':>10}")
+    for n in SIZES:
+        values = [float(i % 1000 - 500) for i in range(n)]
+
+        def make():
+            return LinkedList(values)
+
+        rebuild = measure_fresh(make, lambda ll: LinkedList(scale(value) for value in ll))
+        inplace = measure_fresh(make, lambda ll: ll.map_inplace(scale))
+        vectorized = measure_fresh(make, lambda ll: ll.map_vectorized(lambda array: array * 0.5 + 1.0)) \
+            if has_numpy else 0.0
+        print(f"{n:>8} {'map':>8} {rebuild:>16.4f} {inplace:>12.4f} {cell(vectorized):>10}")
+
+        rebuild = measure_fresh(make, lambda ll: LinkedList(value for value in ll if is_positive(value)))
+        inplace = measure_fresh(make, lambda ll: ll.filter_inplace(is_positive))
+        vectorized = measure_fresh(make, lambda ll: ll.filter_vectorized(lambda array: array > 0.0)) \
+            if has_numpy else 0.0
+        print(f"{n:>8} {'filter':>8} {rebuild:>16.4f} {inplace:>12.4f} {cell(vectorized):>10}")
+
+        linked_list = make()
+        builtin_sum = measure(lambda: sum(linked_list))
+        method_sum = measure(lambda: linked_list.sum())
+        vectorized = measure(lambda: linked_list.to_numpy().sum()) if has_numpy else 0.0
+        print(f"{n:>8} {'sum':>8} {builtin_sum:>16.4f} {method_sum:>12.4f} {cell(vectorized):>10}")
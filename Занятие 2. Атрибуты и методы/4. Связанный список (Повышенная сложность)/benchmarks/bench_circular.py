@@ -0,0 +1,72 @@
+"""
+Кольцевой список CircularLinkedList: построение через tail, сдвиг rotate и обход по кругу с next_item.
+
+Для сравнения построение выполняется и прежним способом, когда append каждый раз обходит кольцо
+в поисках узла перед head. Это O(n²), поэтому прежний способ замеряется только на небольших размерах.
+Обход по кругу сравнивается с collections.deque.
+Запуск: python bench_circular.py
+"""
+from collections import deque
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 5, 10 ** 6)
+WALK_SIZES = (10 ** 3, 10 ** 4)
+STEPS = 10 ** 6
+
+
+def append_by_walk(ring, data) -> None:
+    """Прежний append: поиск последнего узла проходом по всему кольцу."""
+    new_node = ring_module.Node(data)
+    if not ring.head:
+        ring.head = new_node
+        new_node.next = ring.head
+    else:
+        current = ring.head
+        while current.next != ring.head:
+            current = current.next
+        current.next = new_node
+        new_node.next = ring.head
+
+
+def build_by_walk(n: int) -> None:
+    ring = ring_module.CircularLinkedList()
+    for i in range(n):
+        append_by_walk(ring, i)
+
+
+def build(n: int):
+    ring = ring_module.CircularLinkedList()
+    for i in range(n):
+        ring.append(i)
+    return ring
+
+
+def round_robin(ring) -> None:
+    for _ in range(STEPS):
+        ring.next_item()
+
+
+def round_robin_deque(queue: deque) -> None:
+    for _ in range(STEPS):
+        queue[0]
+        queue.rotate(-1)
+
+
+if __name__ == "__main__":
+    ring_module = load_task_module("task1_3_CircularLinkedList")
+
+    print(f"{'n':>8} {'append с обходом, с':>20} {'append через tail, с':>21}")
+    for n in WALK_SIZES:
+        print(f"{n:>8} {measure(lambda: build_by_walk(n), 1):>20.4f} {measure(lambda: build(n), 1):>21.4f}")
+
+    print()
+    print(f"{'n':>8} {'построение, с':>14} {'rotate(n // 2), с':>18} {'next_item, мкс':>15} {'deque, мкс':>11}")
+    for n in SIZES:
+        ring = build(n)
+        queue = deque(range(n))
+        build_time = measure(lambda: build(n), 1)
+        rotate_time = measure(lambda: ring.rotate(n // 2))
+        ring_step = measure(lambda: round_robin(ring), 1) / STEPS
+        deque_step = measure(lambda: round_robin_deque(queue), 1) / STEPS
+        print(f"{n:>8} {build_time:>14.4f} {rotate_time:>18.4f} {ring_step * 1e6:>15.3f} {deque_step * 1e6:>11.3f}")
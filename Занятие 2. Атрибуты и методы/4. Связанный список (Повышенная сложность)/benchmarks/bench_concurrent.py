@@ -0,0 +1,107 @@
+"""
+ConcurrentDoublyLinkedList в нескольких потоках: проверка под нагрузкой и пропускная способность.
+
+Проверка: потоки одновременно добавляют, удаляют и перебирают значения, после чего проверяется,
+что ссылки next и prev согласованы, длина совпадает с числом узлов и ни одно значение не потеряно.
+Пропускная способность: производители добавляют значения, потребители забирают их popleft(block=True).
+Для сравнения то же самое делается через queue.Queue.
+Запуск: python bench_concurrent.py
+"""
+import queue
+import random
+import threading
+import time
+
+from loader import load_task_module
+
+ITEMS = 2 * 10 ** 5
+THREAD_COUNTS = (1, 2, 4, 8)
+STRESS_THREADS = 8
+STRESS_OPERATIONS = 20000
+
+
+def check_links(linked_list) -> int:
+    """Проверяет ссылки next и prev и возвращает число узлов."""
+    count = 0
+    prev_node = None
+    current = linked_list.head
+    while current is not None:
+        assert current.prev is prev_node, "Ссылка prev не указывает на предыдущий узел"
+        prev_node = current
+        current = current.next
+        count += 1
+    assert prev_node is linked_list.tail, "tail не указывает на последний узел"
+    assert count == linked_list.len, "Длина не совпадает с числом узлов"
+    return count
+
+
+def stress(list_cls) -> None:
+    shared = list_cls()
+    added = [0] * STRESS_THREADS
+    removed = [0] * STRESS_THREADS
+
+    def worker(number: int) -> None:
+        rnd = random.Random(number)
+        for _ in range(STRESS_OPERATIONS):
+            operation = rnd.random()
+            if operation < 0.5:
+                shared.append(number)
+                added[number] += 1
+            elif operation < 0.9:
+                try:
+                    shared.popleft() if operation < 0.7 else shared.pop()
+                    removed[number] += 1
+                except IndexError:
+                    pass
+            elif operation < 0.95:
+                sum(1 for _ in shared)
+            else:
+                len(shared)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(STRESS_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert check_links(shared) == sum(added) - sum(removed), "Значения потерялись или задвоились"
+    print(f"Проверка под нагрузкой пройдена: {STRESS_THREADS} потоков, в списке осталось {len(shared)} значений")
+
+
+def throughput(make_channel, put, get, threads_count: int) -> float:
+    """Возвращает число переданных значений в секунду при threads_count производителях и потребителях."""
+    channel = make_channel()
+    per_thread = ITEMS // threads_count
+
+    def produce() -> None:
+        for value in range(per_thread):
+            put(channel, value)
+
+    def consume() -> None:
+        for _ in range(per_thread):
+            get(channel)
+
+    threads = [threading.Thread(target=produce) for _ in range(threads_count)]
+    threads += [threading.Thread(target=consume) for _ in range(threads_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return per_thread * threads_count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    ConcurrentDoublyLinkedList = load_task_module("task4_1_DoublyLinkedList_reversed",
+                                                  "concurrent_doubly_linked_list").ConcurrentDoublyLinkedList
+    stress(ConcurrentDoublyLinkedList)
+
+    channels = {
+        "ConcurrentDLL": (ConcurrentDoublyLinkedList, lambda c, v: c.append(v), lambda c: c.popleft(block=True)),
+        "queue.Queue": (queue.Queue, lambda c, v: c.put(v), lambda c: c.get()),
+    }
+    print(f"{'потоков':>8} {'канал':>14} {'значений/с':>11}")
+    for threads_count in THREAD_COUNTS:
+        for name, (make_channel, put, get) in channels.items():
+            rate = throughput(make_channel, put, get, threads_count)
+            print(f"{threads_count:>8} {name:>14} {rate:>11.0f}")
@@ -0,0 +1,28 @@
+"""
+Замер времени построения LinkedList через конструктор (extend) и через последовательные append.
+
+При хранении ссылки на хвост время на один элемент не должно расти вместе с размером списка.
+Запуск: python bench_construction.py
+"""
+from loader import load_task_module, measure
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def append_all(linked_list_cls, n: int):
+    linked_list = linked_list_cls()
+    for i in range(n):
+        linked_list.append(i)
+    return linked_list
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task3_10_LinkedList__add__sub__").LinkedList
+
+    print(f"{'n':>10} {'extend, с':>12} {'мкс/элемент':>12} {'append, с':>12} {'мкс/элемент':>12}")
+    for n in SIZES:
+        repeat = 1 if n >= 10 ** 6 else 3
+        extend_time = measure(lambda: LinkedList(range(n)), repeat)
+        append_time = measure(lambda: append_all(LinkedList, n), repeat)
+        print(f"{n:>10} {extend_time:>12.4f} {extend_time / n * 1e6:>12.3f} "
+              f"{append_time:>12.4f} {append_time / n * 1e6:>12.3f}")
@@ -0,0 +1,41 @@
+"""
+Поиск по значению в LinkedList: обычный перебор против режима hashed со словарём значений.
+
+Словарь значений нужно построить и поддерживать, поэтому создание списка в режиме hashed дороже.
+В последней колонке - сколько поисков (in, count) окупают эту разницу при данном размере списка.
+Запуск: python bench_hashed_lookup.py
+"""
+import random
+
+from loader import load_task_module, measure
+
+SIZES = (10, 100, 1000, 10 ** 4, 10 ** 5)
+LOOKUPS = 200
+
+
+def lookup(linked_list, values) -> None:
+    for value in values:
+        value in linked_list
+        linked_list.count(value)
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+
+    print(f"{'n':>7} {'создание, с':>12} {'с hashed, с':>12} {'поиск, мкс':>11} {'с hashed, мкс':>14} {'окупается за':>13}")
+    for n in SIZES:
+        random.seed(0)
+        # Половина искомых значений есть в списке, половина - нет
+        values = [random.randrange(2 * n) for _ in range(LOOKUPS)]
+        plain = LinkedList(range(n))
+        hashed = LinkedList(range(n), hashed=True)
+
+        build_plain = measure(lambda: LinkedList(range(n)))
+        build_hashed = measure(lambda: LinkedList(range(n), hashed=True))
+        lookup_plain = measure(lambda: lookup(plain, values)) / LOOKUPS
+        lookup_hashed = measure(lambda: lookup(hashed, values)) / LOOKUPS
+
+        saving = lookup_plain - lookup_hashed
+        break_even = f"{(build_hashed - build_plain) / saving:.0f}" if saving > 0 else "-"
+        print(f"{n:>7} {build_plain:>12.5f} {build_hashed:>12.5f} {lookup_plain * 1e6:>11.2f} "
+              f"{lookup_hashed * 1e6:>14.2f} {break_even:>13}")
@@ -0,0 +1,37 @@
+"""
+Замер доступа к узлу по индексу через step_by_step_on_nodes.
+
+LinkedList всегда идёт от головы, DoublyLinkedList идёт от ближайшего конца,
+поэтому в худшем случае проходит не больше половины списка.
+Запуск: python bench_index_access.py
+"""
+import random
+
+from loader import load_task_module, measure
+
+SIZE = 10 ** 4
+ACCESSES = 2000
+
+
+def access_all(linked_list, indexes):
+    for index in indexes:
+        linked_list.step_by_step_on_nodes(index)
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task3_10_LinkedList__add__sub__").LinkedList
+    DoublyLinkedList = load_task_module("task4_1_DoublyLinkedList_reversed").DoublyLinkedList
+
+    random.seed(0)
+    cases = {
+        "случайный": [random.randrange(SIZE) for _ in range(ACCESSES)],
+        "последний": [SIZE - 1] * ACCESSES,
+    }
+
+    print(f"{'индекс':>10} {'LinkedList, с':>15} {'DoublyLinkedList, с':>20}")
+    for name, indexes in cases.items():
+        linked_list = LinkedList(range(SIZE))
+        doubly_linked_list = DoublyLinkedList(range(SIZE))
+        single_time = measure(lambda: access_all(linked_list, indexes))
+        doubly_time = measure(lambda: access_all(doubly_linked_list, indexes))
+        print(f"{name:>10} {single_time:>15.4f} {doubly_time:>20.4f}")
@@ -0,0 +1,38 @@
+"""
+Сравнение обычного и ускоренного (indexed) режимов доступа по индексу в LinkedList.
+
+Запуск: python bench_indexed_access.py
+"""
+import random
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+OPERATIONS = 1000
+
+
+def random_access(linked_list, indexes):
+    for index in indexes:
+        linked_list.step_by_step_on_nodes(index)
+
+
+def insert_and_pop(linked_list, indexes):
+    for index in indexes:
+        linked_list.insert(index, index)
+        linked_list.pop(index)
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+
+    print(f"{'n':>8} {'операция':>12} {'обычный, с':>12} {'indexed, с':>12}")
+    for n in SIZES:
+        random.seed(0)
+        indexes = [random.randrange(n) for _ in range(OPERATIONS)]
+        for name, operation in (("индекс", random_access), ("insert/pop", insert_and_pop)):
+            times = []
+            for indexed in (False, True):
+                linked_list = LinkedList(range(n))
+                linked_list.set_indexed(indexed)
+                times.append(measure(lambda: operation(linked_list, indexes)))
+            print(f"{n:>8} {name:>12} {times[0]:>12.4f} {times[1]:>12.4f}")
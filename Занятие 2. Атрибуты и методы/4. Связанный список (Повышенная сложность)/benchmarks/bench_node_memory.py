@@ -0,0 +1,47 @@
+"""
+Сравнение памяти и времени создания узлов: Node со __slots__ и обычный класс узла со словарём атрибутов.
+
+Память считается через tracemalloc как прирост выделенной памяти на один узел.
+Запуск: python bench_node_memory.py
+"""
+import time
+import tracemalloc
+
+from loader import load_task_module
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def build_chain(node_cls, n: int):
+    """Создаёт цепочку из n узлов, связывая их напрямую через атрибут next."""
+    head = last = node_cls(0)
+    for i in range(1, n):
+        node = node_cls(i)
+        last.next = node
+        last = node
+    return head
+
+
+def measure_chain(node_cls, n: int) -> tuple[float, float]:
+    """Возвращает время создания цепочки в секундах и память на один узел в байтах."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    head = build_chain(node_cls, n)
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del head
+    return elapsed, allocated / n
+
+
+if __name__ == "__main__":
+    nodes = {
+        "__slots__": load_task_module("task5_1_LinkedList_performance", "node").Node,
+        "__dict__": load_task_module("task1_1_LinkedList").Node,
+    }
+
+    print(f"{'n':>8} {'узел':>10} {'время, с':>10} {'байт/узел':>10}")
+    for n in SIZES:
+        for name, node_cls in nodes.items():
+            elapsed, per_node = measure_chain(node_cls, n)
+            print(f"{n:>8} {name:>10} {elapsed:>10.4f} {per_node:>10.1f}")
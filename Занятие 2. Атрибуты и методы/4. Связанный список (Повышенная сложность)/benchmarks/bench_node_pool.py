@@ -0,0 +1,56 @@
+"""
+Пул узлов NodePool при частых вставках и удалениях: время, число созданных узлов и запусков сборщика мусора.
+
+Список работает как очередь: в конец добавляется значение, из начала удаляется.
+Запуски сборщика мусора считаются через gc.callbacks. В CPython удалённый узел освобождается
+сразу по счётчику ссылок, поэтому сборщик мусора запускается одинаково редко с пулом и без него.
+Главное, что меняет пул, - число созданных объектов Node.
+Запуск: python bench_node_pool.py
+"""
+import gc
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 3, 10 ** 5)
+OPERATIONS = 10 ** 6
+
+
+class CollectionCounter:
+    """Считает запуски сборщика мусора, пока подключён к gc.callbacks."""
+
+    def __init__(self):
+        self.collections = 0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self.collections += 1
+
+
+def churn(linked_list) -> None:
+    for i in range(OPERATIONS):
+        linked_list.append(i)
+        linked_list.pop(0)
+        if i % 3 == 0:
+            # Значение-кортеж тоже отслеживается сборщиком мусора, как в реальных данных
+            linked_list.insert(0, (i, i))
+            linked_list.pop(0)
+
+
+if __name__ == "__main__":
+    module = load_task_module("task5_1_LinkedList_performance")
+    LinkedList, NodePool = module.LinkedList, module.NodePool
+
+    print(f"{'n':>7} {'пул':>5} {'время, с':>9} {'создано узлов':>14} {'запусков gc':>12}")
+    for n in SIZES:
+        for pool in (None, NodePool()):
+            LinkedList.set_node_pool(pool)
+            linked_list = LinkedList(range(n))
+            created_before = 0 if pool is None else pool.created
+            counter = CollectionCounter()
+            gc.callbacks.append(counter)
+            elapsed = measure(lambda: churn(linked_list), 1)
+            gc.callbacks.remove(counter)
+            # Без пула каждая вставка создаёт новый узел
+            created = OPERATIONS * 4 // 3 if pool is None else pool.created - created_before
+            print(f"{n:>7} {'да' if pool else 'нет':>5} {elapsed:>9.4f} {created:>14} {counter.collections:>12}")
+    LinkedList.set_node_pool(None)
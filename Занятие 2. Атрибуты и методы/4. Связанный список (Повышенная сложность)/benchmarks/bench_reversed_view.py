@@ -0,0 +1,57 @@
+"""
+Обратный проход по DoublyLinkedList: ленивое представление view(step=-1) против копирования в list.
+
+Для каждого способа замеряются время полного прохода и пик дополнительной памяти по данным tracemalloc.
+Время и память замеряются в разных проходах, потому что tracemalloc сам замедляет программу.
+Пока в задании не добавлен __reversed__, reversed(dll) работает через __getitem__ за O(n²),
+поэтому он замеряется только на небольшом размере.
+Запуск: python bench_reversed_view.py
+"""
+import time
+import tracemalloc
+
+from loader import load_task_module
+
+SIZES = (10 ** 5, 10 ** 6)
+SMALL_SIZE = 2000
+
+
+def consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def measure_pass(make_iterable) -> tuple[float, float]:
+    """Возвращает время прохода в секундах и пик дополнительной памяти в мегабайтах."""
+    start = time.perf_counter()
+    consume(make_iterable())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    consume(make_iterable())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+if __name__ == "__main__":
+    DoublyLinkedList = load_task_module("task4_1_DoublyLinkedList_reversed").DoublyLinkedList
+
+    ways = {
+        "view(step=-1)": lambda dll: dll.view(step=-1),
+        "list(dll)[::-1]": lambda dll: list(dll.iter_values())[::-1],
+        "view(0, None, 2)": lambda dll: dll.view(0, None, 2),
+        "list(dll)[::2]": lambda dll: list(dll.iter_values())[::2],
+    }
+
+    print(f"{'n':>8} {'способ':>17} {'время, с':>9} {'память, МБ':>11}")
+    for n in SIZES:
+        dll = DoublyLinkedList(range(n))
+        for name, make_iterable in ways.items():
+            elapsed, peak = measure_pass(lambda: make_iterable(dll))
+            print(f"{n:>8} {name:>17} {elapsed:>9.4f} {peak:>11.2f}")
+
+    dll = DoublyLinkedList(range(SMALL_SIZE))
+    if "__reversed__" not in vars(DoublyLinkedList):
+        elapsed, peak = measure_pass(lambda: reversed(dll))
+        print(f"{SMALL_SIZE:>8} {'reversed(dll)':>17} {elapsed:>9.4f} {peak:>11.2f}")
@@ -0,0 +1,47 @@
+"""
+Сохранение и загрузка LinkedList: to_bytes/from_bytes и to_jsonl/from_jsonl.
+
+Для сравнения замеряется обычный путь: значения копируются в list, list сохраняется через pickle,
+а при загрузке список строится заново из list.
+Запуск: python bench_serialization.py
+"""
+import os
+import pickle
+import tempfile
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 5, 10 ** 6, 3 * 10 ** 6)
+
+
+def via_list(linked_list_cls, linked_list) -> None:
+    data = pickle.dumps(list(linked_list.iter_values()), protocol=5)
+    linked_list_cls(pickle.loads(data))
+
+
+def via_bytes(linked_list_cls, linked_list) -> None:
+    linked_list_cls.from_bytes(linked_list.to_bytes())
+
+
+def via_jsonl(linked_list_cls, linked_list, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fp:
+        linked_list.to_jsonl(fp)
+    with open(path, encoding="utf-8") as fp:
+        linked_list_cls.from_jsonl(fp)
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "values.jsonl")
+        print(f"{'n':>8} {'значения':>9} {'через list, с':>14} {'to_bytes, с':>12} {'jsonl, с':>9} {'размер, МБ':>11}")
+        for n in SIZES:
+            for kind, values in (("int", range(n)), ("float", (i / 2 for i in range(n)))):
+                linked_list = LinkedList(values)
+                repeat = 1 if n > 10 ** 6 else 3
+                list_time = measure(lambda: via_list(LinkedList, linked_list), repeat)
+                bytes_time = measure(lambda: via_bytes(LinkedList, linked_list), repeat)
+                jsonl_time = measure(lambda: via_jsonl(LinkedList, linked_list, path), repeat)
+                size = len(linked_list.to_bytes()) / 2 ** 20
+                print(f"{n:>8} {kind:>9} {list_time:>14.4f} {bytes_time:>12.4f} {jsonl_time:>9.4f} {size:>11.2f}")
@@ -0,0 +1,48 @@
+"""
+Операции со срезами LinkedList за один проход против поэлементных операций по индексу.
+
+Поэлементный вариант каждый раз идёт от головы списка, то есть стоит O(n²),
+поэтому он замеряется только на небольших размерах.
+Запуск: python bench_slices.py
+"""
+from loader import load_task_module, measure
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+ELEMENTWISE_LIMIT = 10 ** 4
+
+
+def get_by_index(linked_list, start: int, stop: int):
+    return LinkedList(linked_list[i] for i in range(start, stop))
+
+
+def set_by_index(linked_list, start: int, stop: int) -> None:
+    for i in range(start, stop):
+        linked_list[i] = -i
+
+
+def delete_by_index(linked_list, start: int, stop: int) -> None:
+    for _ in range(start, stop):
+        del linked_list[start]
+
+
+def row(name: str, n: int, slice_time: float, elementwise_time) -> str:
+    elementwise = f"{elementwise_time:>14.4f}" if elementwise_time is not None else f"{'-':>14}"
+    return f"{n:>7} {name:>9} {slice_time:>9.4f} {elementwise}"
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+
+    print(f"{'n':>7} {'операция':>9} {'срез, с':>9} {'по индексу, с':>14}")
+    for n in SIZES:
+        # Операции над средней половиной списка
+        start, stop = n // 4, 3 * n // 4
+        linked_list = LinkedList(range(n))
+        small = n <= ELEMENTWISE_LIMIT
+
+        print(row("ll[a:b]", n, measure(lambda: linked_list[start:stop]),
+                  measure(lambda: get_by_index(linked_list, start, stop), 1) if small else None))
+        print(row("ll[a:b]=", n, measure(lambda: linked_list.__setitem__(slice(start, stop), range(start, stop))),
+                  measure(lambda: set_by_index(linked_list, start, stop), 1) if small else None))
+        print(row("del", n, measure(lambda: linked_list.__delitem__(slice(start, stop)), 1),
+                  measure(lambda: delete_by_index(LinkedList(range(n)), start, stop), 1) if small else None))
@@ -0,0 +1,53 @@
+"""
+Сортировка LinkedList: сортировка слиянием на месте (sort) и sorted_copy
+против копирования в list, sorted() и сборки нового списка.
+
+В первые столбцы входит только сортировка: sort() против sorted() по значениям с записью их обратно в те же узлы,
+исходный список строится перед каждым замером вне замера. В замеры sorted_copy() и сборки через list
+входит и построение исходного LinkedList.
+Запуск: python bench_sort.py
+"""
+import random
+
+from loader import load_task_module, measure, measure_fresh
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def sort_through_list(linked_list) -> None:
+    """Сортирует значения встроенной sorted() и записывает их обратно в те же узлы."""
+    node = linked_list.head
+    for value in sorted(linked_list.iter_values()):
+        node.value = value
+        node = node.next
+
+
+def sorted_copy(linked_list_cls, values) -> None:
+    linked_list = linked_list_cls(values)
+    linked_list.sorted_copy()
+
+
+def list_round_trip(linked_list_cls, values) -> None:
+    linked_list = linked_list_cls(values)
+    linked_list_cls(sorted(linked_list.iter_values()))
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+
+    print(f"{'n':>8} {'sort(), с':>10} {'sorted() в узлы, с':>19} {'разница':>8} "
+          f"{'sorted_copy(), с':>17} {'через list, с':>14}")
+    for n in SIZES:
+        random.seed(0)
+        values = [random.random() for _ in range(n)]
+        repeat = 1 if n >= 10 ** 5 else 3
+
+        def make():
+            return LinkedList(values)
+
+        in_place_time = measure_fresh(make, lambda linked_list: linked_list.sort(), repeat)
+        through_list_time = measure_fresh(make, sort_through_list, repeat)
+        copy_time = measure(lambda: sorted_copy(LinkedList, values), repeat)
+        round_trip_time = measure(lambda: list_round_trip(LinkedList, values), repeat)
+        print(f"{n:>8} {in_place_time:>10.4f} {through_list_time:>19.4f} {in_place_time / through_list_time:>7.1f}x "
+              f"{copy_time:>17.4f} {round_trip_time:>14.4f}")
@@ -0,0 +1,57 @@
+"""
+Отсортированный контейнер при поочерёдном добавлении значений: SortedLinkedList (список с пропусками)
+против пересортировки LinkedList из task3_7 после каждого добавления и против bisect.insort для list.
+
+Пересортировка стоит O(n log n) на каждое добавление, поэтому замеряется только на небольших размерах.
+Запуск: python bench_sorted_list.py
+"""
+import bisect
+import random
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+RESORT_LIMIT = 2000
+
+
+def fill_with_resort(linked_list_cls, values):
+    linked_list = linked_list_cls()
+    for value in values:
+        linked_list.append(value)
+        linked_list = linked_list_cls(sorted(linked_list))
+    return linked_list
+
+
+def fill_sorted(sorted_list_cls, values):
+    sorted_list = sorted_list_cls()
+    for value in values:
+        sorted_list.add(value)
+    return sorted_list
+
+
+def fill_insort(values):
+    result = []
+    for value in values:
+        bisect.insort(result, value)
+    return result
+
+
+def lookups(container, values) -> None:
+    for value in values:
+        value in container
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task3_7_LinkedList_sorted").LinkedList
+    SortedLinkedList = load_task_module("task5_1_LinkedList_performance", "sorted_linked_list").SortedLinkedList
+
+    print(f"{'n':>7} {'пересортировка, с':>18} {'SortedLinkedList, с':>20} {'insort, с':>10} {'1000 x in, с':>13}")
+    for n in SIZES:
+        random.seed(0)
+        values = [random.random() for _ in range(n)]
+        resort = f"{measure(lambda: fill_with_resort(LinkedList, values), 1):>18.4f}" if n <= RESORT_LIMIT else f"{'-':>18}"
+        sorted_time = measure(lambda: fill_sorted(SortedLinkedList, values), 1)
+        insort_time = measure(lambda: fill_insort(values), 1)
+        sorted_list = fill_sorted(SortedLinkedList, values)
+        lookup_time = measure(lambda: lookups(sorted_list, values[:1000]))
+        print(f"{n:>7} {resort} {sorted_time:>20.4f} {insort_time:>10.4f} {lookup_time:>13.4f}")
@@ -0,0 +1,40 @@
+"""
+Склейка пачек данных: splice (+=) за O(1) против копирования значений через + и extend.
+
+В замеры входит только склейка, пачки создаются заранее.
+Запуск: python bench_splice.py
+"""
+from loader import load_task_module, measure
+
+BATCHES = 100
+BATCH_SIZE = 10 ** 4
+
+
+def make_batches(linked_list_cls):
+    return [linked_list_cls(range(BATCH_SIZE)) for _ in range(BATCHES)]
+
+
+def stitch_with_splice(batches) -> None:
+    result = batches[0]
+    for batch in batches[1:]:
+        result += batch
+
+
+def stitch_with_copy(batches) -> None:
+    result = batches[0]
+    for batch in batches[1:]:
+        result.extend(batch.iter_values())
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+    DoublyLinkedList = load_task_module("task4_1_DoublyLinkedList_reversed").DoublyLinkedList
+
+    print(f"{'список':>17} {'splice, с':>10} {'копирование, с':>15}")
+    for linked_list_cls in (LinkedList, DoublyLinkedList):
+        # Пачки после splice становятся пустыми, поэтому на каждый замер нужны новые пачки
+        splice_time = min(measure(lambda: stitch_with_splice(batches), 1)
+                          for batches in (make_batches(linked_list_cls) for _ in range(3)))
+        copy_time = min(measure(lambda: stitch_with_copy(batches), 1)
+                        for batches in (make_batches(linked_list_cls) for _ in range(3)))
+        print(f"{linked_list_cls.__name__:>17} {splice_time:>10.6f} {copy_time:>15.4f}")
@@ -0,0 +1,28 @@
+"""
+Стоимость отладочного вывода вызовов методов на примере sorted(linked_list).
+
+Запуск: python bench_tracing.py
+"""
+import io
+
+from loader import load_task_module, measure
+
+SIZE = 10 ** 4
+
+if __name__ == "__main__":
+    task = load_task_module("task5_1_LinkedList_performance")
+    LinkedList = task.LinkedList
+    linked_list = LinkedList(range(SIZE))
+
+    sink = io.StringIO()
+    tracers = {
+        "выключен": None,
+        "счётчик": task.MethodCallCounter(),
+        "print": lambda message: print(message, file=sink),
+    }
+
+    print(f"{'трассировщик':>14} {'sorted, с':>10}")
+    for name, tracer in tracers.items():
+        LinkedList.set_tracer(tracer)
+        print(f"{name:>14} {measure(lambda: sorted(linked_list)):>10.4f}")
+    LinkedList.set_tracer(None)
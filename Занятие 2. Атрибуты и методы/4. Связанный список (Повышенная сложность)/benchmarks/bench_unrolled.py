@@ -0,0 +1,51 @@
+"""
+Сравнение LinkedList и UnrolledLinkedList: построение, перебор, доступ по индексу и память.
+
+Запуск: python bench_unrolled.py
+"""
+import random
+import tracemalloc
+
+from loader import load_task_module, measure
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+ACCESSES = 100
+
+
+def memory_per_item(factory, n: int) -> float:
+    """Возвращает память в байтах на один элемент по данным tracemalloc."""
+    tracemalloc.start()
+    container = factory(range(n))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return allocated / n
+
+
+def iterate(container) -> None:
+    for _ in container:
+        pass
+
+
+def random_access(container, indexes) -> None:
+    for index in indexes:
+        container[index]
+
+
+if __name__ == "__main__":
+    LinkedList = load_task_module("task5_1_LinkedList_performance").LinkedList
+    UnrolledLinkedList = load_task_module("task5_1_LinkedList_performance", "unrolled_linked_list").UnrolledLinkedList
+    implementations = {"LinkedList": LinkedList, "Unrolled": UnrolledLinkedList}
+
+    print(f"{'n':>8} {'список':>11} {'создание, с':>12} {'перебор, с':>11} {'индекс, с':>10} {'байт/эл.':>9}")
+    for n in SIZES:
+        random.seed(0)
+        indexes = [random.randrange(n) for _ in range(ACCESSES)]
+        repeat = 1 if n >= 10 ** 6 else 3
+        for name, factory in implementations.items():
+            container = factory(range(n))
+            build_time = measure(lambda: factory(range(n)), repeat)
+            iterate_time = measure(lambda: iterate(container), repeat)
+            access_time = measure(lambda: random_access(container, indexes), repeat)
+            per_item = memory_per_item(factory, n)
+            print(f"{n:>8} {name:>11} {build_time:>12.4f} {iterate_time:>11.4f} {access_time:>10.4f} {per_item:>9.1f}")
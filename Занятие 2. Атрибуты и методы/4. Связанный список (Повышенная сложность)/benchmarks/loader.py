@@ -0,0 +1,59 @@
+"""
+Вспомогательные функции для замеров производительности связных списков из заданий урока.
+
+Каждое задание импортирует свой собственный модуль `node` (а дополнительные модули задания - ещё и `main`),
+поэтому модули заданий загружаются по очереди, а модули предыдущего задания убираются из кэша импорта.
+"""
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+LESSON_DIR = Path(__file__).resolve().parent.parent
+TASK_MODULES = ("node", "main")  # Модули, которые в каждом задании свои
+
+
+def load_task_module(task_name: str, module_name: str = "main") -> ModuleType:
+    """
+    Загружает модуль задания вместе с его собственным node.py.
+    :param task_name: Имя папки задания, например 'task3_10_LinkedList__add__sub__'
+    :param module_name: Имя модуля внутри папки задания
+    :return: Загруженный модуль
+    """
+    task_dir = str(LESSON_DIR / task_name)
+    saved_modules = {name: sys.modules.pop(name) for name in TASK_MODULES if name in sys.modules}
+    sys.path.insert(0, task_dir)
+    try:
+        spec = importlib.util.spec_from_file_location(f"{task_name}_{module_name}", Path(task_dir, f"{module_name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(task_dir)
+        for name in TASK_MODULES:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved_modules)
+
+    return module
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> float:
+    """Возвращает лучшее время выполнения функции в секундах из нескольких запусков."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_fresh(make: Callable[[], Any], run: Callable[[Any], Any], repeat: int = 3) -> float:
+    """Лучшее время run(make()) из нескольких запусков, make выполняется вне замера."""
+    best = float("inf")
+    for _ in range(repeat):
+        container = make()
+        start = time.perf_counter()
+        run(container)
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,238 @@
+"""
+Общий набор замеров: связные списки из заданий урока против list и collections.deque.
+
+Для каждой реализации и каждого размера замеряются append, extend, вставка в начало, середину и конец,
+доступ по индексу, поиск (in), перебор, перебор с конца, сортировка и память на один элемент.
+Операции, которых у реализации нет (или которые у неё работают только через медленный обходной путь),
+пропускаются и в отчёте остаются пустыми.
+
+Результаты печатаются таблицей и при необходимости сохраняются в CSV или JSON. Если передать
+прошлый JSON-отчёт через --baseline, будут показаны операции, которые стали заметно медленнее.
+
+Запуск: python run_suite.py [--sizes 100 1000] [--csv report.csv] [--json report.json] [--baseline old.json]
+"""
+import argparse
+import csv
+import datetime
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Optional
+
+from loader import load_task_module
+
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+CONSTANT_OPERATIONS = 1000  # Сколько раз повторяется операция за O(1) в одном замере
+LINEAR_BUDGET = 10 ** 6  # Для операций за O(n) число повторов подбирается так, чтобы пройти примерно столько элементов
+REGRESSION_RATIO = 1.2  # Во сколько раз операция должна замедлиться, чтобы попасть в список ухудшений
+
+
+def load_implementations() -> dict[str, Callable[..., Any]]:
+    """Возвращает реализации для сравнения: имя -> функция, создающая контейнер из итерируемого объекта."""
+    return {
+        "LinkedList": load_task_module("task5_1_LinkedList_performance").LinkedList,
+        "DoublyLinkedList": load_task_module("task4_1_DoublyLinkedList_reversed").DoublyLinkedList,
+        "UnrolledLinkedList": load_task_module("task5_1_LinkedList_performance",
+                                               "unrolled_linked_list").UnrolledLinkedList,
+        "list": list,
+        "deque": deque,
+    }
+
+
+def linear_count(n: int) -> int:
+    return max(1, min(100, LINEAR_BUDGET // n))
+
+
+def reverse_iterator(container) -> Optional[Callable[[], Any]]:
+    """
+    Способ перебора с конца. reversed() для LinkedList и UnrolledLinkedList пошёл бы через __getitem__
+    за O(n²), поэтому для них перебор с конца не замеряется.
+    """
+    if isinstance(container, (list, deque)):
+        return lambda: reversed(container)
+    if hasattr(container, "view"):
+        return lambda: container.view(step=-1)
+    return None
+
+
+def repeat_calls(method: Callable, count: int, *args) -> None:
+    for _ in range(count):
+        method(*args)
+
+
+def consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+# Операции: имя -> (меняет ли операция контейнер, функция (container, n), которая возвращает
+# (что замерять для контейнера, число повторов операции) или None, если у реализации нет такой операции).
+# Операции, которые меняют контейнер, каждый раз получают новый контейнер из n элементов.
+OPERATIONS: dict[str, tuple[bool, Callable[[Any, int], Optional[tuple[Callable[[Any], Any], int]]]]] = {
+    "append": (True, lambda container, n: (
+        lambda c: repeat_calls(c.append, CONSTANT_OPERATIONS, 0), CONSTANT_OPERATIONS)),
+    "extend": (True, lambda container, n: (lambda c: c.extend(range(n)), 1)),
+    "insert_head": (True, lambda container, n: (
+        (lambda c: repeat_calls(c.insert, CONSTANT_OPERATIONS, 0, 0), CONSTANT_OPERATIONS)
+        if hasattr(container, "insert") else None)),
+    "insert_middle": (True, lambda container, n: (
+        (lambda c: repeat_calls(c.insert, linear_count(n), n // 2, 0), linear_count(n))
+        if hasattr(container, "insert") else None)),
+    "insert_tail": (True, lambda container, n: (
+        # Индекс больше любой длины: как и list.insert, все реализации вставляют тогда в конец
+        (lambda c: repeat_calls(c.insert, CONSTANT_OPERATIONS, sys.maxsize, 0), CONSTANT_OPERATIONS)
+        if hasattr(container, "insert") else None)),
+    "index": (False, lambda container, n: (
+        lambda c: repeat_calls(c.__getitem__, linear_count(n), n // 2), linear_count(n))),
+    "contains": (False, lambda container, n: (
+        lambda c: repeat_calls(c.__contains__, linear_count(n), -1), linear_count(n))),
+    "iterate": (False, lambda container, n: (consume, 1)),
+    "reverse": (False, lambda container, n: (
+        (lambda c: consume(reverse_iterator(c)()), 1) if reverse_iterator(container) else None)),
+    "sort": (True, lambda container, n: ((lambda c: c.sort(), 1) if hasattr(container, "sort") else None)),
+}
+
+
+def best_time(run: Callable[[Any], Any], repeat: int, setup: Callable[[], Any]) -> float:
+    """
+    Лучшее время из repeat запусков run(setup()). setup выполняется вне замера.
+    Как и timeit, на время замера сборщик мусора отключается, чтобы его запуски не искажали результат.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def measure_memory(factory, n: int) -> float:
+    """Память в байтах на один элемент по данным tracemalloc."""
+    tracemalloc.start()
+    container = factory(range(n))
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return allocated / n
+
+
+def run_suite(sizes, repeat: int) -> list[dict]:
+    rows = []
+    for name, factory in load_implementations().items():
+        for n in sizes:
+            container = factory(range(n))
+            # Сортируются перемешанные значения, для остальных операций порядок значений не важен
+            shuffled = list(range(n))
+            random.Random(0).shuffle(shuffled)
+            for operation, (mutating, prepare) in OPERATIONS.items():
+                prepared = prepare(container, n)
+                if prepared is None:
+                    rows.append(make_row(name, operation, n, None, 0))
+                    continue
+                run, count = prepared
+                if operation == "extend":
+                    setup = factory
+                elif operation == "sort":
+                    setup = lambda: factory(shuffled)
+                elif mutating:
+                    setup = lambda: factory(range(n))
+                else:
+                    setup = lambda: container
+                rows.append(make_row(name, operation, n, best_time(run, repeat, setup), count))
+
+            rows.append({"implementation": name, "operation": "memory", "size": n, "count": 1,
+                         "seconds": None, "bytes_per_item": round(measure_memory(factory, n), 1)})
+            print(f"{name} n={n} готово", file=sys.stderr)
+    return rows
+
+
+def make_row(name: str, operation: str, n: int, elapsed: Optional[float], count: int) -> dict:
+    """Строка отчёта: время на одну операцию в секундах или None, если операция не замерялась."""
+    return {"implementation": name, "operation": operation, "size": n, "count": count,
+            "seconds": None if elapsed is None else elapsed / count, "bytes_per_item": None}
+
+
+def print_table(rows: list[dict]) -> None:
+    """Печатает таблицу: строки - размер и операция, столбцы - реализации. Память выводится в байтах на элемент."""
+    names = list(dict.fromkeys(row["implementation"] for row in rows))
+    cells = {}
+    for row in rows:
+        if row["operation"] == "memory":
+            cell = f"{row['bytes_per_item']:.1f} Б"
+        elif row["seconds"] is None:
+            cell = "-"
+        else:
+            cell = f"{row['seconds'] * 1e6:.3f}"
+        cells[row["size"], row["operation"], row["implementation"]] = cell
+
+    print("Время одной операции в микросекундах, память в байтах на элемент")
+    print(f"{'n':>8} {'операция':>14}" + "".join(f" {name:>19}" for name in names))
+    for size, operation in dict.fromkeys((row["size"], row["operation"]) for row in rows):
+        print(f"{size:>8} {operation:>14}" + "".join(f" {cells.get((size, operation, name), ''):>19}" for name in names))
+
+
+def save_csv(rows: list[dict], path: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.DictWriter(fp, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def save_json(rows: list[dict], path: str) -> None:
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": rows,
+    }
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(report, fp, ensure_ascii=False, indent=1)
+
+
+def print_regressions(rows: list[dict], baseline_path: str) -> None:
+    """Сравнивает результаты с прошлым JSON-отчётом и печатает операции, которые стали медленнее."""
+    with open(baseline_path, encoding="utf-8") as fp:
+        baseline = {(row["implementation"], row["operation"], row["size"]): row for row in json.load(fp)["results"]}
+
+    print(f"\nЗамедлились больше чем в {REGRESSION_RATIO} раза по сравнению с {baseline_path}:")
+    found = False
+    for row in rows:
+        old = baseline.get((row["implementation"], row["operation"], row["size"]))
+        if old is None:
+            continue
+        for field in ("seconds", "bytes_per_item"):
+            if row[field] and old[field] and row[field] > old[field] * REGRESSION_RATIO:
+                found = True
+                print(f"  {row['implementation']} {row['operation']} n={row['size']} {field}: "
+                      f"{old[field]:.3g} -> {row[field]:.3g} ({row[field] / old[field]:.2f}x)")
+    if not found:
+        print("  нет")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение связных списков урока с list и deque")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Размеры контейнеров")
+    parser.add_argument("--repeat", type=int, default=3, help="Число запусков, берётся лучшее время")
+    parser.add_argument("--csv", help="Сохранить результаты в CSV-файл")
+    parser.add_argument("--json", help="Сохранить результаты в JSON-файл")
+    parser.add_argument("--baseline", help="Прошлый JSON-отчёт для поиска замедлений")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.repeat)
+    print_table(results)
+    if args.csv:
+        save_csv(results, args.csv)
+    if args.json:
+        save_json(results, args.json)
+    if args.baseline:
+        print_regressions(results, args.baseline)
@@ -5,6 +5,8 @@
 
 
 class Node:
+    __slots__ = ("data", "next")  # Узлов в кольце может быть очень много, словарь атрибутов им не нужен
+
     def __init__(self, data):
         self.data = data  # Данные
         self.next = None  # Ссылка на следующий узел
@@ -13,6 +15,11 @@ class Node:
 class CircularLinkedList:
     def __init__(self):
         self.head = None  # Начало списка
+        self.tail = None  # Последний узел, его next всегда указывает на head
+        self.len = 0  # Количество узлов в кольце
+
+    def __len__(self):
+        return self.len
 
     def append(self, data):
         new_node = Node(data)
@@ -21,11 +28,76 @@ class CircularLinkedList:
             self.head = new_node
             new_node.next = self.head
         else:
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            current.next = new_node
+            # Узел перед head хранится в tail, поэтому искать его проходом по кольцу не нужно
+            self.tail.next = new_node
             new_node.next = self.head  # Последний узел указывает на head, замыкая список
+        self.tail = new_node
+        self.len += 1
+
+    def prepend(self, data):
+        if not self.head:
+            self.append(data)
+            return
+        # Новый узел встаёт между tail и head, то есть в начало кольца
+        new_node = Node(data)
+        new_node.next = self.head
+        self.tail.next = new_node
+        self.head = new_node
+        self.len += 1
+
+    def rotate(self, k=1):
+        """
+        Сдвигает начало кольца на k узлов вперёд: первые k элементов переходят в конец.
+        Узлы не перевязываются, передвигаются только head и tail, поэтому сдвиг стоит O(k mod n).
+        Отрицательное k сдвигает начало назад, для односвязного кольца это n - |k| шагов вперёд.
+        """
+        if self.len == 0:
+            return
+        for _ in range(k % self.len):
+            self.tail = self.head
+            self.head = self.head.next
+
+    def popleft(self):
+        # Удаляет узел head и возвращает его данные
+        if not self.head:
+            raise IndexError("Список пуст")
+        removed_node = self.head
+        if self.len == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.head = removed_node.next
+            self.tail.next = self.head
+        self.len -= 1
+        return removed_node.data
+
+    def next_item(self):
+        """
+        Возвращает данные из head и сдвигает начало кольца на один узел.
+        Так по кольцу можно ходить по очереди бесконечно, как в планировщике задач по кругу (round-robin).
+        """
+        if not self.head:
+            raise IndexError("Список пуст")
+        data = self.head.data
+        self.tail = self.head
+        self.head = self.head.next
+        return data
+
+    def __iter__(self):
+        # Один полный круг по кольцу, начиная с head
+        return self.iter_items(self.len)
+
+    def iter_items(self, count):
+        """
+        Генератор, который выдаёт данные count узлов подряд, начиная с head.
+        Если count больше длины списка, обход продолжается по кругу, но никогда не бывает бесконечным.
+        """
+        current = self.head
+        if current is None:
+            return
+        for _ in range(count):
+            yield current.data
+            current = current.next
 
     def print_list(self):
         if not self.head:
@@ -47,3 +119,23 @@ if __name__ == "__main__":
     cll.append(3)
 
     cll.print_list()  # 1 -> 2 -> 3 -> ... (возвращаемся к началу)
+
+    cll.prepend(0)
+    cll.rotate(2)
+    cll.print_list()  # 2 -> 3 -> 0 -> 1 -> ... (возвращаемся к началу)
+    print(list(cll.iter_items(6)))  # [2, 3, 0, 1, 2, 3]
+
+    # Планировщик по кругу: каждая задача по очереди получает один шаг работы
+    tasks = CircularLinkedList()
+    for name, steps in (("A", 2), ("B", 1), ("C", 3)):
+        tasks.append([name, steps])
+    while len(tasks):
+        task = tasks.head.data
+        task[1] -= 1
+        print(f"Шаг задачи {task[0]}", end="")
+        if task[1] == 0:
+            tasks.popleft()  # Задача выполнена, убираем её из кольца
+            print(" - задача завершена")
+        else:
+            tasks.next_item()  # Переходим к следующей задаче
+            print()
@@ -1,13 +1,50 @@
-from typing import Iterable, Optional, Any
+from typing import Callable, Iterable, Iterator, Optional, Any
 
 from node import Node
 
 
+class LinkedListIterator:
+    """
+    Итератор по значениям связного списка.
+    Положение итерации хранится в самом итераторе, а не в списке, поэтому
+    несколько циклов по одному и тому же списку не мешают друг другу.
+    """
+    __slots__ = ("current_node", "tracer")
+
+    def __init__(self, head: Optional[Node], tracer: Optional[Callable[[str], None]] = None):
+        self.current_node = head  # Узел, значение которого будет возвращено следующим
+        self.tracer = tracer  # Функция для отладочного вывода, как у списка
+
+    def __iter__(self) -> "LinkedListIterator":
+        return self
+
+    def __next__(self) -> Any:
+        """Возвращает следующий элемент при итерации."""
+        if self.tracer is not None:
+            self.tracer("Вызов метода __next__")
+        if self.current_node is None:  # Если больше нет элементов
+            raise StopIteration
+        current_value = self.current_node.value  # Получаем значение текущего узла
+        self.current_node = self.current_node.next  # Переходим на следующий узел
+        return current_value
+
+
 class LinkedList:
+    tracer: Optional[Callable[[str], None]] = None  # Функция отладочного вывода, None - вывод выключен
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Callable[[str], None]]) -> None:
+        """
+        Включает отладочный вывод вызовов методов, например LinkedList.set_tracer(print).
+        Если передать None, вывод выключается и методы не тратят время на формирование сообщений.
+        """
+        cls.tracer = None if tracer is None else staticmethod(tracer)
+
     def __init__(self, data: Iterable = None):
         """Конструктор связного списка"""
         self.len = 0  # Добавили атрибут хранящий число узлов в связанном списке
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None  # Последний узел, нужен для добавления в конец за O(1)
 
         if data is not None:
             self.extend(data)
@@ -41,11 +78,9 @@ class LinkedList:
         if self.head is None:
             self.head = append_node
         else:
-            last_index = self.len - 1  # Индекс последнего узла
-            last_node = self.step_by_step_on_nodes(last_index)  # Получаем последний узел
-
-            self.linked_nodes(last_node, append_node)
+            self.linked_nodes(self.tail, append_node)  # Последний узел всегда доступен через tail
 
+        self.tail = append_node
         self.len += 1
 
     def extend(self, iterable: Iterable[Any]) -> None:
@@ -53,8 +88,30 @@ class LinkedList:
         Добавляет несколько новых узлов в конец списка из итерируемого объекта.
         :param iterable: Итерируемый объект с элементами для добавления.
         """
+        first_node = None
+        last_node = None
+        count = 0
+        # Сначала связываем новые узлы в отдельную цепочку
         for item in iterable:
-            self.append(item)
+            new_node = Node(item)
+            if first_node is None:
+                first_node = new_node
+            else:
+                self.linked_nodes(last_node, new_node)
+            last_node = new_node
+            count += 1
+
+        if first_node is None:
+            return
+
+        # Затем одним действием присоединяем цепочку к хвосту списка
+        if self.head is None:
+            self.head = first_node
+        else:
+            self.linked_nodes(self.tail, first_node)
+
+        self.tail = last_node
+        self.len += count
 
     @staticmethod
     def linked_nodes(left_node: Node, right_node: Optional[Node] = None) -> None:
@@ -76,47 +133,52 @@ class LinkedList:
         return f"LinkedList({' -> '.join(nodes)})"
 
     def __len__(self):
-        print(f"Вызов метода __len__")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __len__")
         return self.len
 
     def __getitem__(self, index: int) -> Any:
         """ Метод возвращает значение узла по указанному индексу. """
-        print(f"Вызов метода __getitem__, запросили index={index}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __getitem__, запросили index={index}")
         node = self.step_by_step_on_nodes(index)
         return node.value
 
-    def __iter__(self):
-        """Инициализирует итератор и возвращает его."""
-        print("Вызов метода __iter__")
-        self.current_node = self.head
-        return self
+    def __iter__(self) -> Iterator[Any]:
+        """Создаёт новый итератор по списку и возвращает его."""
+        if self.tracer is None:
+            return self.iter_values()  # Без отладочного вывода достаточно генератора
+        self.tracer("Вызов метода __iter__")
+        return LinkedListIterator(self.head, self.tracer)
 
-    def __next__(self):
-        """Возвращает следующий элемент при итерации."""
-        print("Вызов метода __next__")
-        if self.current_node is None:  # Если больше нет элементов
-            raise StopIteration
-        current_value = self.current_node.value  # Получаем значение текущего узла
-        self.current_node = self.current_node.next  # Переходим на следующий узел
-        return current_value
+    def iter_values(self) -> Iterator[Any]:
+        """Генератор значений узлов без отладочного вывода, для проходов по списку внутри методов."""
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
 
     def __add__(self, other: Any) -> 'LinkedList':
         """
         Метод добавляет либо отдельный узел (Node), либо другой связанный список (LinkedList)
         в конец текущего связного списка.
         """
-        print(f"Вызов метода __add__, запросили добавление other={other}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __add__, запросили добавление other={other}")
         # TODO реализуйте метод
 
     def __sub__(self, node: Node) -> 'LinkedList':
         """
         Метод удаляет указанный узел (Node) из связанного списка, если он существует.
         """
-        print(f"Вызов метода __sub__, запросили удаление node={node}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __sub__, запросили удаление node={node}")
         # TODO реализуйте метод
 
 
 if __name__ == "__main__":
+    LinkedList.set_tracer(print)  # Показываем, какие методы вызываются
+
     # Создаем исходный связанный список
     ll = LinkedList([1, 2, 3])
     print("Исходный список:", ll)
@@ -138,3 +200,8 @@ if __name__ == "__main__":
         ll = ll - Node(10)  # Попытка удалить несуществующий узел
     except ValueError:
         print("Ожидаемая ошибка")
+
+    # После удаления последнего узла новый узел должен добавляться за новым последним узлом
+    ll = ll - Node(6)
+    ll = ll + Node(7)
+    print("После удаления Node(6) и добавления Node(7):", ll)  # LinkedList(1 -> 2 -> 4 -> 5 -> 7)
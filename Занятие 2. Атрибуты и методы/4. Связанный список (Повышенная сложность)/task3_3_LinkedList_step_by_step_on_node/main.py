@@ -8,6 +8,7 @@ class LinkedList:
         """Конструктор связного списка"""
         self.len = 0  # Добавили атрибут хранящий число узлов в связанном списке
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None  # Последний узел, нужен для добавления в конец за O(1)
 
         if data is not None:
             self.extend(data)
@@ -41,11 +42,9 @@ class LinkedList:
         if self.head is None:
             self.head = append_node
         else:
-            last_index = self.len - 1  # Индекс последнего узла
-            last_node = self.step_by_step_on_nodes(last_index)  # Получаем последний узел
-
-            self.linked_nodes(last_node, append_node)
+            self.linked_nodes(self.tail, append_node)  # Последний узел всегда доступен через tail
 
+        self.tail = append_node
         self.len += 1
 
     def extend(self, iterable: Iterable[Any]) -> None:
@@ -53,8 +52,30 @@ class LinkedList:
         Добавляет несколько новых узлов в конец списка из итерируемого объекта.
         :param iterable: Итерируемый объект с элементами для добавления.
         """
+        first_node = None
+        last_node = None
+        count = 0
+        # Сначала связываем новые узлы в отдельную цепочку
         for item in iterable:
-            self.append(item)
+            new_node = Node(item)
+            if first_node is None:
+                first_node = new_node
+            else:
+                self.linked_nodes(last_node, new_node)
+            last_node = new_node
+            count += 1
+
+        if first_node is None:
+            return
+
+        # Затем одним действием присоединяем цепочку к хвосту списка
+        if self.head is None:
+            self.head = first_node
+        else:
+            self.linked_nodes(self.tail, first_node)
+
+        self.tail = last_node
+        self.len += count
 
     @staticmethod
     def linked_nodes(left_node: Node, right_node: Optional[Node] = None) -> None:
@@ -3,6 +3,7 @@ from typing import Any, Optional
 
 class Node:
     """ Класс, который описывает узел связного списка. """
+    __slots__ = ("value", "next")  # Без словаря атрибутов каждый узел занимает заметно меньше памяти
 
     def __init__(self, value: Any, next_: Optional["Node"] = None):
         """
@@ -13,7 +14,8 @@ class Node:
         self.value = value
 
         self.next = None
-        self.set_next(next_)
+        if next_ is not None:  # Пустую ссылку проверять не нужно, это частый случай при создании списка
+            self.set_next(next_)
 
     def __repr__(self) -> str:
         return f"Node({self.value}, {None})" if self.next is None else f"Node({self.value}, Node({self.next}))"
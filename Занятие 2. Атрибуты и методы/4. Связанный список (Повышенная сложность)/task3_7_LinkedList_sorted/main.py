@@ -1,13 +1,50 @@
-from typing import Iterable, Optional, Any
+from typing import Callable, Iterable, Iterator, Optional, Any
 
 from node import Node
 
 
+class LinkedListIterator:
+    """
+    Итератор по значениям связного списка.
+    Положение итерации хранится в самом итераторе, а не в списке, поэтому
+    несколько циклов по одному и тому же списку не мешают друг другу.
+    """
+    __slots__ = ("current_node", "tracer")
+
+    def __init__(self, head: Optional[Node], tracer: Optional[Callable[[str], None]] = None):
+        self.current_node = head  # Узел, значение которого будет возвращено следующим
+        self.tracer = tracer  # Функция для отладочного вывода, как у списка
+
+    def __iter__(self) -> "LinkedListIterator":
+        return self
+
+    def __next__(self) -> Any:
+        """Возвращает следующий элемент при итерации."""
+        if self.tracer is not None:
+            self.tracer("Вызов метода __next__")
+        if self.current_node is None:  # Если больше нет элементов
+            raise StopIteration
+        current_value = self.current_node.value  # Получаем значение текущего узла
+        self.current_node = self.current_node.next  # Переходим на следующий узел
+        return current_value
+
+
 class LinkedList:
+    tracer: Optional[Callable[[str], None]] = None  # Функция отладочного вывода, None - вывод выключен
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Callable[[str], None]]) -> None:
+        """
+        Включает отладочный вывод вызовов методов, например LinkedList.set_tracer(print).
+        Если передать None, вывод выключается и методы не тратят время на формирование сообщений.
+        """
+        cls.tracer = None if tracer is None else staticmethod(tracer)
+
     def __init__(self, data: Iterable = None):
         """Конструктор связного списка"""
         self.len = 0  # Добавили атрибут хранящий число узлов в связанном списке
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None  # Последний узел, нужен для добавления в конец за O(1)
 
         if data is not None:
             self.extend(data)
@@ -41,11 +78,9 @@ class LinkedList:
         if self.head is None:
             self.head = append_node
         else:
-            last_index = self.len - 1  # Индекс последнего узла
-            last_node = self.step_by_step_on_nodes(last_index)  # Получаем последний узел
-
-            self.linked_nodes(last_node, append_node)
+            self.linked_nodes(self.tail, append_node)  # Последний узел всегда доступен через tail
 
+        self.tail = append_node
         self.len += 1
 
     def extend(self, iterable: Iterable[Any]) -> None:
@@ -53,8 +88,30 @@ class LinkedList:
         Добавляет несколько новых узлов в конец списка из итерируемого объекта.
         :param iterable: Итерируемый объект с элементами для добавления.
         """
+        first_node = None
+        last_node = None
+        count = 0
+        # Сначала связываем новые узлы в отдельную цепочку
         for item in iterable:
-            self.append(item)
+            new_node = Node(item)
+            if first_node is None:
+                first_node = new_node
+            else:
+                self.linked_nodes(last_node, new_node)
+            last_node = new_node
+            count += 1
+
+        if first_node is None:
+            return
+
+        # Затем одним действием присоединяем цепочку к хвосту списка
+        if self.head is None:
+            self.head = first_node
+        else:
+            self.linked_nodes(self.tail, first_node)
+
+        self.tail = last_node
+        self.len += count
 
     @staticmethod
     def linked_nodes(left_node: Node, right_node: Optional[Node] = None) -> None:
@@ -76,18 +133,21 @@ class LinkedList:
         return f"LinkedList({' -> '.join(nodes)})"
 
     def __len__(self):
-        print(f"Вызов метода __len__")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __len__")
         return self.len
 
     def __getitem__(self, index: int) -> Any:
         """ Метод возвращает значение узла по указанному индексу. """
-        print(f"Вызов метода __getitem__, запросили index={index}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __getitem__, запросили index={index}")
         node = self.step_by_step_on_nodes(index)
         return node.value
 
     def __setitem__(self, key: int, value: Any):
         """ Метод устанавливает значение узла по указанному индексу. """
-        print(f"Вызов метода __setitem__, запросили изменение на позиции key={key} со значением value={value}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __setitem__, запросили изменение на позиции key={key} со значением value={value}")
         node = self.step_by_step_on_nodes(key)
         node.value = value
 
@@ -95,10 +155,13 @@ class LinkedList:
         """ Метод удаляет значение узла по указанному индексу. В качестве следующего элемента
         ставится тот, что был за удаляемым.
         """
-        print(f"Вызов метода __delitem__, запросили удаление на позиции key={key}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __delitem__, запросили удаление на позиции key={key}")
         if key == 0:
             # Удаление первого узла
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None  # Список опустел
         else:
             # Поиск предыдущего узла
             previous_node = self.step_by_step_on_nodes(key - 1)
@@ -107,12 +170,15 @@ class LinkedList:
             # Следующий узел определяется относительно текущего
             next_node = current_node.next if current_node else None
             self.linked_nodes(previous_node, next_node)
+            if next_node is None:
+                self.tail = previous_node  # Удалили последний узел
 
         self.len -= 1
 
     def __contains__(self, value: Any) -> bool:
         """Метод для поддержки оператора in."""
-        print(f"Вызов метода __contains__, запросили сравнение с value={value}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __contains__, запросили сравнение с value={value}")
 
         current = self.head
         while current is not None:
@@ -121,23 +187,24 @@ class LinkedList:
             current = current.next
         return False
 
-    def __iter__(self):
-        """Инициализирует итератор и возвращает его."""
-        print("Вызов метода __iter__")
-        self.current_node = self.head
-        return self
+    def __iter__(self) -> Iterator[Any]:
+        """Создаёт новый итератор по списку и возвращает его."""
+        if self.tracer is None:
+            return self.iter_values()  # Без отладочного вывода достаточно генератора
+        self.tracer("Вызов метода __iter__")
+        return LinkedListIterator(self.head, self.tracer)
 
-    def __next__(self):
-        """Возвращает следующий элемент при итерации."""
-        print("Вызов метода __next__")
-        if self.current_node is None:  # Если больше нет элементов
-            raise StopIteration
-        current_value = self.current_node.value  # Получаем значение текущего узла
-        self.current_node = self.current_node.next  # Переходим на следующий узел
-        return current_value
+    def iter_values(self) -> Iterator[Any]:
+        """Генератор значений узлов без отладочного вывода, для проходов по списку внутри методов."""
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
 
 
 if __name__ == "__main__":
+    LinkedList.set_tracer(print)  # Показываем, какие методы вызываются
+
     list_ = [1, 2, 3]
     linked_list = LinkedList(list_)
 
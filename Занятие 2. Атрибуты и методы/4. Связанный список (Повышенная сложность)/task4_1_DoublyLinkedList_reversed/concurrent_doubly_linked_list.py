@@ -0,0 +1,162 @@
+import threading
+from typing import Iterable, Iterator, Optional, Any
+
+from main import DoublyLinkedList
+
+
+class ConcurrentDoublyLinkedList(DoublyLinkedList):
+    """
+    Двусвязный список, который можно использовать из нескольких потоков одновременно,
+    например когда одни потоки добавляют значения, а другие забирают их.
+
+    Все операции выполняются под одной блокировкой RLock: в CPython каждая операция над узлами
+    короткая, и одна блокировка обходится дешевле, чем отдельная блокировка на каждом узле.
+    RLock нужен потому, что методы базового класса вызывают друг друга (например, extend вызывает append).
+
+    Итерация идёт по снимку значений, сделанному под блокировкой, поэтому цикл по списку
+    не мешает другим потокам изменять его. Представления view() перебирают узлы без блокировки,
+    их можно использовать, только пока другие потоки не изменяют список.
+    """
+
+    def __init__(self, data: Iterable = None):
+        self.lock = threading.RLock()
+        self.not_empty = threading.Condition(self.lock)  # Ожидание новых значений в popleft/pop с block=True
+        super().__init__(data)
+
+    def append(self, value: Any) -> None:
+        with self.lock:
+            super().append(value)
+            self.not_empty.notify()
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        # Значения собираются до захвата блокировки, чтобы не держать её, пока работает чужой итератор
+        values = list(iterable)
+        with self.lock:
+            for value in values:
+                super().append(value)
+            self.not_empty.notify(len(values))
+
+    def wait_not_empty(self, block: bool, timeout: Optional[float]) -> None:
+        """
+        Вызывается под блокировкой. Ждёт, пока в списке появится значение, если block=True.
+        :raises IndexError: Если список пуст и ждать не нужно или время ожидания вышло
+        """
+        if block and not self.not_empty.wait_for(lambda: self.len > 0, timeout):
+            raise IndexError("Список пуст")
+        if self.len == 0:
+            raise IndexError("Список пуст")
+
+    def popleft(self, block: bool = False, timeout: Optional[float] = None) -> Any:
+        """
+        Удаляет и возвращает первое значение.
+        :param block: Ждать, пока другой поток добавит значение, если список пуст
+        :param timeout: Максимальное время ожидания в секундах, None - ждать без ограничения
+        """
+        with self.lock:
+            self.wait_not_empty(block, timeout)
+            value = self.head.value
+            super().__delitem__(0)  # Узел с индексом 0 находится сразу, без прохода по списку
+            return value
+
+    def pop(self, block: bool = False, timeout: Optional[float] = None) -> Any:
+        """
+        Удаляет и возвращает последнее значение.
+        :param block: Ждать, пока другой поток добавит значение, если список пуст
+        :param timeout: Максимальное время ожидания в секундах, None - ждать без ограничения
+        """
+        with self.lock:
+            self.wait_not_empty(block, timeout)
+            value = self.tail.value
+            super().__delitem__(-1)  # Узел с индексом -1 берётся из tail
+            return value
+
+    def snapshot(self) -> list:
+        """Возвращает копию значений списка, сделанную под блокировкой."""
+        with self.lock:
+            return list(self.iter_values())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.snapshot())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.snapshot())
+
+    def __repr__(self) -> str:
+        with self.lock:
+            return f"Concurrent{super().__repr__()}"
+
+    def __len__(self):
+        with self.lock:
+            return super().__len__()
+
+    def __getitem__(self, index: int) -> Any:
+        with self.lock:
+            return super().__getitem__(index)
+
+    def __setitem__(self, key: int, value: Any):
+        with self.lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key: int):
+        with self.lock:
+            super().__delitem__(key)
+
+    def __contains__(self, value: Any) -> bool:
+        with self.lock:
+            return super().__contains__(value)
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+
+    def splice(self, other: DoublyLinkedList) -> None:
+        """Присоединяет узлы другого списка под блокировками обоих списков."""
+        if isinstance(other, ConcurrentDoublyLinkedList) and other is not self:
+            # Блокировки берутся в одном и том же порядке, иначе два встречных splice могут ждать друг друга вечно
+            first, second = sorted((self, other), key=id)
+            with first.lock, second.lock:
+                super().splice(other)
+                self.not_empty.notify_all()
+        else:
+            with self.lock:
+                super().splice(other)
+                self.not_empty.notify_all()
+
+    def __iadd__(self, other: DoublyLinkedList) -> 'ConcurrentDoublyLinkedList':
+        """
+        Оператор +=. Для ll += ll значения копируются снимком, и весь += выполняется под одной блокировкой,
+        чтобы другие потоки не изменили список между чтением и добавлением. Другой список присоединяется через splice.
+        """
+        if other is self:
+            with self.lock:
+                self.extend(self.snapshot())
+        else:
+            self.splice(other)
+        return self
+
+    def split_at(self, index: int) -> tuple[DoublyLinkedList, DoublyLinkedList]:
+        """Разрезает список под блокировкой. Получившиеся списки - обычные DoublyLinkedList."""
+        with self.lock:
+            return super().split_at(index)
+
+
+if __name__ == '__main__':
+    shared = ConcurrentDoublyLinkedList()
+    consumed = []
+
+    def produce(start: int) -> None:
+        for value in range(start, start + 1000):
+            shared.append(value)
+
+    def consume() -> None:
+        for _ in range(2000):
+            consumed.append(shared.popleft(block=True))
+
+    threads = [threading.Thread(target=produce, args=(start,)) for start in range(0, 4000, 1000)]
+    threads += [threading.Thread(target=consume) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(len(shared), len(consumed), sorted(consumed) == list(range(4000)))  # 0 4000 True
@@ -1,9 +1,103 @@
-from typing import Iterable, Optional, Any
+from typing import Callable, Iterable, Iterator, Optional, Any
 
 from node import Node
 
 
+class DoublyLinkedListIterator:
+    """
+    Итератор по значениям двусвязного списка.
+    Положение итерации хранится в самом итераторе, а не в списке, поэтому
+    несколько циклов по одному и тому же списку не мешают друг другу.
+    """
+    __slots__ = ("current_node", "tracer")
+
+    def __init__(self, head: Optional[Node], tracer: Optional[Callable[[str], None]] = None):
+        self.current_node = head  # Узел, значение которого будет возвращено следующим
+        self.tracer = tracer  # Функция для отладочного вывода, как у списка
+
+    def __iter__(self) -> "DoublyLinkedListIterator":
+        return self
+
+    def __next__(self) -> Any:
+        """Возвращает следующий элемент при итерации."""
+        if self.tracer is not None:
+            self.tracer("Вызов метода __next__")
+        if self.current_node is None:  # Если больше нет элементов
+            raise StopIteration
+        current_value = self.current_node.value  # Получаем значение текущего узла
+        self.current_node = self.current_node.next  # Переходим на следующий узел
+        return current_value
+
+
+class DoublyLinkedListView:
+    """
+    Представление части двусвязного списка по правилам среза dll[start:stop:step], но без копирования значений.
+    Границы вычисляются при каждом проходе заново, поэтому представление видит изменения списка.
+    Менять список во время прохода по представлению нельзя.
+    """
+    __slots__ = ("linked_list", "slice")
+
+    def __init__(self, linked_list: "DoublyLinkedList", start: Optional[int] = None,
+                 stop: Optional[int] = None, step: Optional[int] = None):
+        if step == 0:
+            raise ValueError('Шаг среза не может быть равен нулю')
+        self.linked_list = linked_list
+        self.slice = slice(start, stop, step)
+
+    def indexes(self) -> range:
+        """Индексы узлов, которые попадают в представление при текущей длине списка."""
+        return range(*self.slice.indices(self.linked_list.len))
+
+    def __len__(self) -> int:
+        return len(self.indexes())
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_indexes(self.indexes())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return self.iter_indexes(self.indexes()[::-1])
+
+    def iter_indexes(self, indexes: range) -> Iterator[Any]:
+        """
+        Генератор значений узлов с индексами из indexes.
+        До первого узла идём от ближайшего конца списка, дальше - по ссылкам next или prev через каждые step узлов.
+        """
+        if not indexes:
+            return
+
+        current_node = self.linked_list.step_by_step_on_nodes(indexes[0])
+        step = indexes.step
+        if step == 1 or step == -1:
+            # Частый случай прохода подряд, без вложенного цикла по пропускаемым узлам
+            for _ in range(len(indexes) - 1):
+                yield current_node.value
+                current_node = current_node.next if step == 1 else current_node.prev
+            yield current_node.value
+            return
+
+        skipped = range(abs(step))
+        for _ in range(len(indexes) - 1):
+            yield current_node.value
+            if step > 0:
+                for _ in skipped:
+                    current_node = current_node.next
+            else:
+                for _ in skipped:
+                    current_node = current_node.prev
+        yield current_node.value
+
+
 class DoublyLinkedList:
+    tracer: Optional[Callable[[str], None]] = None  # Функция отладочного вывода, None - вывод выключен
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Callable[[str], None]]) -> None:
+        """
+        Включает отладочный вывод вызовов методов, например DoublyLinkedList.set_tracer(print).
+        Если передать None, вывод выключается и методы не тратят время на формирование сообщений.
+        """
+        cls.tracer = None if tracer is None else staticmethod(tracer)
+
     def __init__(self, data: Iterable = None):
         """Конструктор связного списка"""
         self.len = 0  # Добавили атрибут хранящий число узлов в связанном списке
@@ -16,6 +110,8 @@ class DoublyLinkedList:
     def step_by_step_on_nodes(self, index: int) -> Node:
         """
         Функция выполняет перемещение по узлам до указанного индекса. И возвращает узел.
+        Движение начинается с того конца списка (head или tail), который ближе к индексу.
+        Отрицательный индекс отсчитывается от конца списка, как у list.
         :param index:
         :return:
         """
@@ -23,12 +119,22 @@ class DoublyLinkedList:
         if not isinstance(index, int):
             raise TypeError('Индекс должен быть целым')
 
+        if index < 0:
+            index += self.len
+
         if not 0 <= index < self.len:
             raise IndexError('Выход за допустимые границы')
 
-        current_node = self.head
-        for _ in range(index):
-            current_node = current_node.next
+        if index < self.len // 2:
+            # Индекс в первой половине списка, идём от головы вперёд
+            current_node = self.head
+            for _ in range(index):
+                current_node = current_node.next
+        else:
+            # Индекс во второй половине списка, идём от хвоста назад
+            current_node = self.tail
+            for _ in range(self.len - 1 - index):
+                current_node = current_node.prev
 
         return current_node
 
@@ -43,7 +149,9 @@ class DoublyLinkedList:
             self.head = append_node
             self.tail = append_node
         else:
-            self.linked_nodes(self.tail, append_node)
+            # Узел создан самим списком, поэтому связываем напрямую, без проверки типа в set_next/set_prev
+            self.tail.next = append_node
+            append_node.prev = self.tail
             self.tail = append_node
 
         self.len += 1
@@ -56,6 +164,69 @@ class DoublyLinkedList:
         for item in iterable:
             self.append(item)
 
+    def clear(self) -> None:
+        """Делает список пустым. Узлы не трогаются, их может забрать другой список."""
+        self.head = None
+        self.tail = None
+        self.len = 0
+
+    def splice(self, other: 'DoublyLinkedList') -> None:
+        """
+        Присоединяет узлы списка other в конец текущего списка за O(1), без копирования.
+        Узлы переходят к текущему списку, а other становится пустым.
+        """
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("Можно присоединить только DoublyLinkedList.")
+        if other is self:
+            raise ValueError("Нельзя присоединить список к самому себе.")
+        if other.head is None:
+            return
+
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.len += other.len
+
+        other.clear()
+
+    def __iadd__(self, other: 'DoublyLinkedList') -> 'DoublyLinkedList':
+        """Оператор +=. Присоединяет другой список за O(1) методом splice, other становится пустым."""
+        if other is self:
+            self.extend(list(self.iter_values()))
+        else:
+            self.splice(other)
+        return self
+
+    def split_at(self, index: int) -> tuple['DoublyLinkedList', 'DoublyLinkedList']:
+        """
+        Разрезает список перед позицией index на два списка без копирования узлов.
+        Узлы переходят к новым спискам, а текущий список становится пустым.
+        :return: Список из первых index значений и список из остальных
+        """
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+        index = min(max(index, 0), self.len)
+
+        left = DoublyLinkedList()
+        right = DoublyLinkedList()
+        if index == 0:
+            right.head, right.tail, right.len = self.head, self.tail, self.len
+        elif index == self.len:
+            left.head, left.tail, left.len = self.head, self.tail, self.len
+        else:
+            right_head = self.step_by_step_on_nodes(index)  # Идёт от ближайшего конца
+            left_tail = right_head.prev
+            left_tail.next = None
+            right_head.prev = None
+            left.head, left.tail, left.len = self.head, left_tail, index
+            right.head, right.tail, right.len = right_head, self.tail, self.len - index
+
+        self.clear()
+        return left, right
+
     @staticmethod
     def linked_nodes(left_node: Node, right_node: Optional[Node] = None) -> None:
         """
@@ -77,18 +248,21 @@ class DoublyLinkedList:
         return f"DoublyLinkedList({' <-> '.join(nodes)})"
 
     def __len__(self):
-        print(f"Вызов метода __len__")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __len__")
         return self.len
 
     def __getitem__(self, index: int) -> Any:
         """ Метод возвращает значение узла по указанному индексу. """
-        print(f"Вызов метода __getitem__, запросили index={index}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __getitem__, запросили index={index}")
         node = self.step_by_step_on_nodes(index)
         return node.value
 
     def __setitem__(self, key: int, value: Any):
         """ Метод устанавливает значение узла по указанному индексу. """
-        print(f"Вызов метода __setitem__, запросили изменение на позиции key={key} со значением value={value}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __setitem__, запросили изменение на позиции key={key} со значением value={value}")
         node = self.step_by_step_on_nodes(key)
         node.value = value
 
@@ -96,34 +270,32 @@ class DoublyLinkedList:
         """ Метод удаляет значение узла по указанному индексу. В качестве следующего элемента
         ставится тот, что был за удаляемым.
         """
-        print(f"Вызов метода __delitem__, запросили удаление на позиции key={key}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __delitem__, запросили удаление на позиции key={key}")
 
-        current = self.head
-        if key == 0:
+        current = self.step_by_step_on_nodes(key)  # Проверяет индекс и идёт от ближайшего конца
+        if current is self.head:
             # Удаление первого узла
             self.head = current.next
             if self.head:
                 self.head.prev = None
             else:
                 self.tail = None  # Если список теперь пуст, сбрасываем tail
-        elif key == self.len - 1:
+        elif current is self.tail:
             # Удаление последнего узла
-            current = self.tail
             self.tail = current.prev
-            if self.tail:
-                self.tail.next = None
-            else:
-                self.head = None  # Если список теперь пуст, сбрасываем head
+            self.tail.next = None
         else:
             # Удаление узла из середины
-            current_node = self.step_by_step_on_nodes(key)
-            self.linked_nodes(current_node.prev, current_node.next)
+            current.prev.next = current.next
+            current.next.prev = current.prev
 
         self.len -= 1
 
     def __contains__(self, value: Any) -> bool:
         """Метод для поддержки оператора in."""
-        print(f"Вызов метода __contains__, запросили сравнение с value={value}")
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __contains__, запросили сравнение с value={value}")
 
         current = self.head
         while current is not None:
@@ -132,27 +304,38 @@ class DoublyLinkedList:
             current = current.next
         return False
 
-    def __iter__(self):
-        """Инициализирует итератор и возвращает его."""
-        print("Вызов метода __iter__")
-        self.current_node = self.head
-        return self
+    def __iter__(self) -> Iterator[Any]:
+        """Создаёт новый итератор по списку и возвращает его."""
+        if self.tracer is None:
+            return self.iter_values()  # Без отладочного вывода достаточно генератора
+        self.tracer("Вызов метода __iter__")
+        return DoublyLinkedListIterator(self.head, self.tracer)
 
-    def __next__(self):
-        """Возвращает следующий элемент при итерации."""
-        print("Вызов метода __next__")
-        if self.current_node is None:  # Если больше нет элементов
-            raise StopIteration
-        current_value = self.current_node.value  # Получаем значение текущего узла
-        self.current_node = self.current_node.next  # Переходим на следующий узел
-        return current_value
+    def iter_values(self) -> Iterator[Any]:
+        """Генератор значений узлов без отладочного вывода, для проходов по списку внутри методов."""
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def view(self, start: Optional[int] = None, stop: Optional[int] = None,
+             step: Optional[int] = None) -> DoublyLinkedListView:
+        """
+        Возвращает представление части списка, которое перебирается как dll[start:stop:step],
+        но не копирует значения: дополнительная память при проходе O(1).
+        Например, dll.view(step=-1) перебирает список с конца.
+        """
+        return DoublyLinkedListView(self, start, stop, step)
 
     # TODO добавьте метод __reversed__ из описания задачи
 
 
 if __name__ == '__main__':
+    DoublyLinkedList.set_tracer(print)  # Показываем, какие методы вызываются
+
     list_ = [1, 2, 3, 4, 5]
     dll = DoublyLinkedList(list_)
     print(dll)
 
     print(list(reversed(dll)))
+    print(list(dll.view(1, None, 2)), list(reversed(dll.view(1, None, 2))))
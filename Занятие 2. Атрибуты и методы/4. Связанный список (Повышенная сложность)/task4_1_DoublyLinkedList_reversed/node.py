@@ -3,6 +3,7 @@ from typing import Any, Optional
 
 class Node:
     """ Класс, который описывает узел двусвязного списка. """
+    __slots__ = ("value", "next", "prev")  # Без словаря атрибутов каждый узел занимает заметно меньше памяти
 
     def __init__(self, value: Any, next_: Optional["Node"] = None, prev_: Optional["Node"] = None):
         """
@@ -13,9 +14,12 @@ class Node:
         self.value = value
 
         self.next = None
-        self.next = None
-        self.set_next(next_)
-        self.set_prev(prev_)
+        self.prev = None
+        # Пустые ссылки проверять не нужно, это частый случай при создании списка
+        if next_ is not None:
+            self.set_next(next_)
+        if prev_ is not None:
+            self.set_prev(prev_)
 
     def __repr__(self) -> str:
         return f"Node({self.value}, {None})" if self.next is None else f"Node({self.value}, Node({self.next}))"
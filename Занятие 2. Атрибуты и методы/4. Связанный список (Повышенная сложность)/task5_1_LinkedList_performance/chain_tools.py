@@ -0,0 +1,99 @@
+"""
+Функции для проверки цепочек узлов, связанных вручную, например через linked_nodes или set_next.
+
+Если в цепочке есть цикл, обычный обход `while current is not None` никогда не закончится.
+Функции ниже находят цикл за O(n) и используют O(1) дополнительной памяти: они не запоминают
+пройденные узлы, а только двигают по цепочке два указателя с разной скоростью.
+"""
+from typing import Optional
+
+from node import Node
+
+
+def find_cycle_floyd(head: Optional[Node]) -> Optional[Node]:
+    """
+    Алгоритм Флойда («черепаха и заяц»): медленный указатель делает один шаг, быстрый - два.
+    Если цикл есть, указатели встретятся внутри него. После этого указатель, запущенный заново от head,
+    и указатель с места встречи, двигаясь по одному шагу, встречаются на первом узле цикла.
+    :return: Первый узел цикла или None, если цепочка заканчивается на None
+    """
+    slow = fast = head
+    while fast is not None and fast.next is not None:
+        slow = slow.next
+        fast = fast.next.next
+        if slow is fast:
+            break
+    else:
+        return None
+
+    slow = head
+    while slow is not fast:
+        slow = slow.next
+        fast = fast.next
+    return slow
+
+
+def find_cycle_brent(head: Optional[Node]) -> Optional[tuple[int, int]]:
+    """
+    Алгоритм Брента: быстрый указатель идёт по одному шагу, а медленный перескакивает к нему,
+    когда число шагов достигает очередной степени двойки. Так сразу находится длина цикла,
+    и в среднем делается меньше шагов, чем в алгоритме Флойда.
+    :return: Индекс первого узла цикла и длина цикла или None, если цикла нет
+    """
+    if head is None:
+        return None
+
+    power = length = 1
+    slow = head
+    fast = head.next
+    while fast is not slow:
+        if fast is None:
+            return None
+        if power == length:
+            slow = fast
+            power *= 2
+            length = 0
+        fast = fast.next
+        length += 1
+
+    # Указатель, отстающий ровно на длину цикла, встретит ведущий на первом узле цикла
+    slow = fast = head
+    for _ in range(length):
+        fast = fast.next
+    start = 0
+    while slow is not fast:
+        slow = slow.next
+        fast = fast.next
+        start += 1
+    return start, length
+
+
+def has_cycle(head: Optional[Node]) -> bool:
+    """Проверяет, есть ли в цепочке, начинающейся с head, цикл."""
+    return find_cycle_brent(head) is not None
+
+
+def chain_repr(head: Optional[Node], limit: int = 20, separator: str = " -> ") -> str:
+    """
+    Строковое представление цепочки узлов без рекурсии.
+    Выводится не больше limit значений, поэтому функция безопасна и для очень длинных цепочек, и для цепочек с циклом.
+    """
+    values = []
+    current = head
+    while current is not None and len(values) < limit:
+        values.append(str(current.value))
+        current = current.next
+    if current is not None:
+        values.append("...")
+    return separator.join(values)
+
+
+if __name__ == "__main__":
+    nodes = [Node(i) for i in range(6)]
+    for left_node, right_node in zip(nodes, nodes[1:]):
+        left_node.set_next(right_node)
+    print(chain_repr(nodes[0]), has_cycle(nodes[0]))  # 0 -> 1 -> 2 -> 3 -> 4 -> 5 False
+
+    nodes[-1].set_next(nodes[2])  # Последний узел ссылается на узел 2, получается цикл
+    print(chain_repr(nodes[0], limit=8), has_cycle(nodes[0]))  # 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 2 -> 3 -> ... True
+    print(find_cycle_floyd(nodes[0]).value, find_cycle_brent(nodes[0]))  # 2 (2, 4)
@@ -0,0 +1,1265 @@
+import copy
+import json
+import pickle
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from math import isqrt
+from typing import Callable, Iterable, Iterator, Optional, TextIO, Union, Any
+
+from chain_tools import chain_repr
+from node import Node
+
+try:
+    import numpy
+except ImportError:  # NumPy нужен только для map_vectorized и filter_vectorized, остальные методы работают без него
+    numpy = None
+
+
+class MethodCallCounter:
+    """
+    Трассировщик для LinkedList.set_tracer, который считает вызовы каждого метода.
+    Сообщения можно передавать дальше, например в print.
+    """
+
+    def __init__(self, forward: Optional[Callable[[str], None]] = None):
+        self.counts = Counter()  # Имя метода -> число вызовов
+        self.forward = forward
+
+    def __call__(self, message: str) -> None:
+        method_name = message.split()[2].rstrip(",")  # Сообщения имеют вид "Вызов метода __len__, ..."
+        self.counts[method_name] += 1
+        if self.forward is not None:
+            self.forward(message)
+
+
+class NodePool:
+    """
+    Пул свободных узлов. Удалённые из списка узлы не выбрасываются, а хранятся в пуле
+    и используются снова при добавлении значений, поэтому при частых вставках и удалениях
+    новые объекты Node почти не создаются.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        :param max_size: Максимальное число свободных узлов в пуле, лишние узлы отдаются сборщику мусора
+        """
+        self.max_size = max_size
+        self.free_nodes: list[Node] = []
+        self.created = 0  # Сколько узлов пришлось создать заново
+        self.reused = 0  # Сколько раз узел был взят из пула
+        self.released = 0  # Сколько узлов вернулось в пул
+        self.dropped = 0  # Сколько узлов не поместилось в пул
+
+    def acquire(self, value: Any) -> Node:
+        """Возвращает узел со значением value: свободный из пула или новый."""
+        if self.free_nodes:
+            node = self.free_nodes.pop()
+            node.value = value
+            self.reused += 1
+            return node
+        self.created += 1
+        return Node(value)
+
+    def release(self, node: Node) -> None:
+        """
+        Возвращает удалённый из списка узел в пул.
+        Ссылки узла очищаются, чтобы пул не удерживал в памяти значения и другие узлы.
+        """
+        node.value = None
+        node.next = None
+        if len(self.free_nodes) < self.max_size:
+            self.free_nodes.append(node)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    def stats(self) -> dict[str, int]:
+        """Счётчики пула в виде словаря."""
+        return {"created": self.created, "reused": self.reused, "released": self.released,
+                "dropped": self.dropped, "free": len(self.free_nodes)}
+
+
+class LinkedListIterator:
+    """
+    Итератор по значениям связного списка.
+    Положение итерации хранится в самом итераторе, а не в списке, поэтому
+    несколько циклов по одному и тому же списку не мешают друг другу.
+    """
+    __slots__ = ("current_node", "tracer")
+
+    def __init__(self, head: Optional[Node], tracer: Optional[Callable[[str], None]] = None):
+        self.current_node = head  # Узел, значение которого будет возвращено следующим
+        self.tracer = tracer  # Функция для отладочного вывода, как у списка
+
+    def __iter__(self) -> "LinkedListIterator":
+        return self
+
+    def __next__(self) -> Any:
+        """Возвращает следующий элемент при итерации."""
+        if self.tracer is not None:
+            self.tracer("Вызов метода __next__")
+        if self.current_node is None:  # Если больше нет элементов
+            raise StopIteration
+        current_value = self.current_node.value  # Получаем значение текущего узла
+        self.current_node = self.current_node.next  # Переходим на следующий узел
+        return current_value
+
+
+class LinkedList:
+    tracer: Optional[Callable[[str], None]] = None  # Функция отладочного вывода, None - вывод выключен
+    node_pool: Optional[NodePool] = None  # Пул узлов для повторного использования, None - пул не используется
+    repr_limit = 1000  # Сколько значений показывает __repr__, остальные заменяются на "..."
+
+    @classmethod
+    def set_tracer(cls, tracer: Optional[Callable[[str], None]]) -> None:
+        """
+        Включает отладочный вывод вызовов методов, например LinkedList.set_tracer(print).
+        Если передать None, вывод выключается и методы не тратят время на формирование сообщений.
+        """
+        cls.tracer = None if tracer is None else staticmethod(tracer)
+
+    @classmethod
+    def set_node_pool(cls, node_pool: Optional[NodePool]) -> None:
+        """
+        Подключает пул узлов ко всем спискам класса, например LinkedList.set_node_pool(NodePool()).
+        Если передать None, узлы снова создаются и удаляются как обычно.
+        Узел из списка возвращается в пул сразу после удаления, поэтому нельзя удалять узлы во время цикла по списку.
+        """
+        cls.node_pool = node_pool
+
+    def __init__(self, data: Iterable = None, indexed: bool = False, hashed: bool = False):
+        """
+        Конструктор связного списка
+        :param data: Итерируемый объект с начальными значениями
+        :param indexed: Режим ускоренного доступа по индексу через контрольные узлы
+        :param hashed: Режим быстрого поиска по значению через словарь значений
+        """
+        self.len = 0  # Добавили атрибут хранящий число узлов в связанном списке
+        self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None  # Последний узел, нужен для добавления в конец за O(1)
+
+        self.indexed = indexed
+        self.checkpoint_nodes: list[Node] = []  # Контрольные узлы, примерно через каждые √n позиций
+        self.checkpoint_indexes: list[int] = []  # Индексы контрольных узлов, всегда по возрастанию
+        self.checkpoint_changes = 0  # Сколько изменений списка было после расстановки контрольных узлов
+
+        self.hashed = hashed
+        self.value_nodes: dict[Any, set[Node]] = {}  # Значение -> узлы с этим значением
+        self.unhashable_count = 0  # Сколько узлов хранят нехешируемые значения, их нет в value_nodes
+
+        if data is not None:
+            self.extend(data)
+
+    def set_indexed(self, indexed: bool) -> None:
+        """
+        Включает или выключает режим ускоренного доступа по индексу.
+        Контрольные узлы будут расставлены при первом обращении по индексу.
+        """
+        self.indexed = indexed
+        self.reset_checkpoints()
+
+    def reset_checkpoints(self) -> None:
+        """Сбрасывает контрольные узлы, они будут построены заново при следующем обращении по индексу."""
+        self.checkpoint_nodes = []
+        self.checkpoint_indexes = []
+        self.checkpoint_changes = 0
+
+    def rebuild_checkpoints(self) -> None:
+        """Расставляет контрольные узлы через каждые √n позиций за один проход по списку."""
+        self.reset_checkpoints()
+        step = max(1, isqrt(self.len))
+
+        current_node = self.head
+        for index in range(self.len):
+            if index % step == 0:
+                self.checkpoint_nodes.append(current_node)
+                self.checkpoint_indexes.append(index)
+            current_node = current_node.next
+
+    def shift_checkpoints(self, index: int) -> None:
+        """Обновляет контрольные узлы после вставки нового узла на позицию index (кроме вставки в конец)."""
+        position = bisect_left(self.checkpoint_indexes, index)
+        for i in range(position, len(self.checkpoint_indexes)):
+            self.checkpoint_indexes[i] += 1
+
+        if index == 0:
+            # Новая голова тоже становится контрольным узлом, чтобы поиск всегда начинался с индекса 0
+            self.checkpoint_nodes.insert(0, self.head)
+            self.checkpoint_indexes.insert(0, 0)
+
+        self.checkpoint_changes += 1
+
+    def unshift_checkpoints(self, index: int, removed_node: Node) -> None:
+        """
+        Обновляет контрольные узлы после удаления узла с позиции index.
+        :param index: Индекс, на котором стоял удалённый узел
+        :param removed_node: Удалённый узел, его ссылка next ещё указывает на следующий узел
+        """
+        position = bisect_left(self.checkpoint_indexes, index)
+        if position < len(self.checkpoint_indexes) and self.checkpoint_indexes[position] == index:
+            # Удалили сам контрольный узел, его место занимает следующий за ним
+            del self.checkpoint_nodes[position]
+            del self.checkpoint_indexes[position]
+            next_is_checkpoint = (position < len(self.checkpoint_indexes)
+                                  and self.checkpoint_indexes[position] == index + 1)
+            if removed_node.next is not None and not next_is_checkpoint:
+                self.checkpoint_nodes.insert(position, removed_node.next)
+                self.checkpoint_indexes.insert(position, index + 1)
+
+        for i in range(position, len(self.checkpoint_indexes)):
+            self.checkpoint_indexes[i] -= 1
+
+        self.checkpoint_changes += 1
+
+    def set_hashed(self, hashed: bool) -> None:
+        """
+        Включает или выключает режим быстрого поиска по значению.
+        При включении словарь значений строится за один проход по списку.
+        """
+        self.hashed = hashed
+        self.rebuild_value_nodes()
+
+    def reset_value_nodes(self) -> None:
+        """Очищает словарь значений."""
+        self.value_nodes = {}
+        self.unhashable_count = 0
+
+    def rebuild_value_nodes(self) -> None:
+        """Строит словарь значений заново по всем узлам списка, если включён режим hashed."""
+        self.reset_value_nodes()
+        if not self.hashed:
+            return
+
+        current_node = self.head
+        while current_node is not None:
+            self.add_value_node(current_node)
+            current_node = current_node.next
+
+    def add_value_node(self, node: Node) -> None:
+        """Добавляет узел в словарь значений. Узлы с нехешируемыми значениями только подсчитываются."""
+        try:
+            nodes = self.value_nodes.get(node.value)
+        except TypeError:
+            self.unhashable_count += 1
+            return
+
+        if nodes is None:
+            self.value_nodes[node.value] = {node}
+        else:
+            nodes.add(node)
+
+    def remove_value_node(self, node: Node) -> None:
+        """Убирает узел из словаря значений."""
+        try:
+            nodes = self.value_nodes[node.value]
+        except TypeError:
+            self.unhashable_count -= 1
+            return
+
+        nodes.discard(node)
+        if not nodes:
+            del self.value_nodes[node.value]
+
+    def hashed_count(self, value: Any) -> Optional[int]:
+        """
+        Возвращает число узлов со значением value по словарю значений.
+        Возвращает None, если словарь не может ответить и нужен обычный перебор: режим hashed выключен,
+        value нехешируемое или в списке есть нехешируемые значения, которые могут оказаться равны value.
+        Перебор нужен и для значений, не равных самим себе, например float('nan'): словарь сначала сравнивает
+        ключи через is и нашёл бы тот же объект nan, а при переборе nan == nan ложно.
+        """
+        if not self.hashed or self.unhashable_count:
+            return None
+        try:
+            nodes = self.value_nodes.get(value, ())
+        except TypeError:
+            return None
+        if value != value:
+            return None
+        return len(nodes)
+
+    def step_by_step_on_nodes(self, index: int) -> Node:
+        """
+        Функция выполняет перемещение по узлам до указанного индекса. И возвращает узел.
+        В режиме indexed движение начинается с ближайшего контрольного узла, а не с головы.
+        :param index:
+        :return:
+        """
+
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+
+        if not 0 <= index < self.len:
+            raise IndexError('Выход за допустимые границы')
+
+        if index == self.len - 1:
+            return self.tail
+
+        if self.indexed:
+            # После примерно √n изменений расстояния между контрольными узлами могли вырасти, строим их заново
+            if not self.checkpoint_nodes or self.checkpoint_changes > isqrt(self.len):
+                self.rebuild_checkpoints()
+
+            position = bisect_right(self.checkpoint_indexes, index) - 1
+            current_node = self.checkpoint_nodes[position]
+            for _ in range(index - self.checkpoint_indexes[position]):
+                current_node = current_node.next
+
+            return current_node
+
+        current_node = self.head
+        for _ in range(index):
+            current_node = current_node.next
+
+        return current_node
+
+    def append(self, value: Any) -> None:
+        """
+        Добавляет новый узел в конец списка.
+        :param value: Значение для нового узла.
+        """
+        # Без пула узел создаётся напрямую, чтобы обычный режим не платил за лишний вызов метода
+        append_node = Node(value) if self.node_pool is None else self.node_pool.acquire(value)
+
+        if self.head is None:
+            self.head = append_node
+        else:
+            # Узел создан самим списком, поэтому связываем напрямую, без проверки типа в set_next
+            self.tail.next = append_node  # Последний узел всегда доступен через tail
+
+        self.tail = append_node
+        self.len += 1
+        self.checkpoint_changes += 1
+        if self.hashed:
+            self.add_value_node(append_node)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Добавляет несколько новых узлов в конец списка из итерируемого объекта.
+        :param iterable: Итерируемый объект с элементами для добавления.
+        """
+        first_node = None
+        last_node = None
+        count = 0
+        hashed = self.hashed
+        make_node = Node if self.node_pool is None else self.node_pool.acquire
+        # Сначала связываем новые узлы в отдельную цепочку
+        for item in iterable:
+            new_node = make_node(item)
+            if first_node is None:
+                first_node = new_node
+            else:
+                last_node.next = new_node
+            last_node = new_node
+            count += 1
+            if hashed:
+                self.add_value_node(new_node)
+
+        if first_node is None:
+            return
+
+        # Затем одним действием присоединяем цепочку к хвосту списка
+        if self.head is None:
+            self.head = first_node
+        else:
+            self.tail.next = first_node
+
+        self.tail = last_node
+        self.len += count
+        self.checkpoint_changes += count
+
+    @classmethod
+    def from_chain(cls, head: Optional[Node], tail: Optional[Node], length: int,
+                   indexed: bool = False, hashed: bool = False) -> 'LinkedList':
+        """
+        Создаёт список из уже связанной цепочки узлов без копирования.
+        :param head: Первый узел цепочки
+        :param tail: Последний узел цепочки, его next должен быть None
+        :param length: Число узлов в цепочке
+        :param indexed: Режим ускоренного доступа по индексу
+        :param hashed: Режим быстрого поиска по значению, словарь значений строится за O(length)
+        """
+        linked_list = cls(indexed=indexed, hashed=hashed)
+        linked_list.head = head
+        linked_list.tail = tail
+        linked_list.len = length
+        if hashed:
+            linked_list.rebuild_value_nodes()
+        return linked_list
+
+    def clear(self) -> None:
+        """Делает список пустым. Узлы не трогаются, их может забрать другой список."""
+        self.head = None
+        self.tail = None
+        self.len = 0
+        self.reset_checkpoints()
+        self.reset_value_nodes()
+
+    def splice(self, other: 'LinkedList') -> None:
+        """
+        Присоединяет узлы списка other в конец текущего списка за O(1), без копирования.
+        Узлы переходят к текущему списку, а other становится пустым.
+        В режиме hashed узлы other ещё нужно добавить в словарь значений: если у other тоже включён
+        этот режим, словари объединяются по значениям, иначе узлы other перебираются.
+        """
+        if not isinstance(other, LinkedList):
+            raise TypeError("Можно присоединить только LinkedList.")
+        if other is self:
+            raise ValueError("Нельзя присоединить список к самому себе.")
+        if other.head is None:
+            return
+
+        if self.hashed:
+            if other.hashed:
+                for value, nodes in other.value_nodes.items():
+                    own_nodes = self.value_nodes.get(value)
+                    if own_nodes is None:
+                        self.value_nodes[value] = nodes
+                    else:
+                        own_nodes |= nodes
+                self.unhashable_count += other.unhashable_count
+            else:
+                current_node = other.head
+                while current_node is not None:
+                    self.add_value_node(current_node)
+                    current_node = current_node.next
+
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.len += other.len
+        self.checkpoint_changes += other.len
+
+        other.clear()
+
+    def split_at(self, index: int) -> tuple['LinkedList', 'LinkedList']:
+        """
+        Разрезает список перед позицией index на два списка без копирования узлов.
+        Узлы переходят к новым спискам, а текущий список становится пустым.
+        :return: Список из первых index значений и список из остальных
+        """
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+        index = min(max(index, 0), self.len)
+
+        if index == 0:
+            left = LinkedList(indexed=self.indexed, hashed=self.hashed)
+            right = LinkedList.from_chain(self.head, self.tail, self.len, self.indexed, self.hashed)
+        elif index == self.len:
+            left = LinkedList.from_chain(self.head, self.tail, self.len, self.indexed, self.hashed)
+            right = LinkedList(indexed=self.indexed, hashed=self.hashed)
+        else:
+            left_tail = self.step_by_step_on_nodes(index - 1)
+            right_head = left_tail.next
+            left_tail.next = None
+            left = LinkedList.from_chain(self.head, left_tail, index, self.indexed, self.hashed)
+            right = LinkedList.from_chain(right_head, self.tail, self.len - index, self.indexed, self.hashed)
+
+        self.clear()
+        return left, right
+
+    @staticmethod
+    def linked_nodes(left_node: Node, right_node: Optional[Node] = None) -> None:
+        """
+        Функция, которая связывает между собой два узла.
+
+        :param left_node: Левый или предыдущий узел
+        :param right_node: Правый или следующий узел
+        """
+        left_node.set_next(right_node)
+
+    def __repr__(self) -> str:
+        """
+        Возвращает строковое представление связанного списка.
+        Выводится не больше repr_limit значений, поэтому repr огромного или испорченного (с циклом) списка
+        не строит гигантскую строку и не зависает.
+        """
+        values = chain_repr(self.head, min(self.len, self.repr_limit))
+        if self.len > self.repr_limit:
+            return f"LinkedList({values}, len={self.len})"
+        return f"LinkedList({values})"
+
+    def validate(self) -> None:
+        """
+        Проверяет, что список не испорчен: цепочка от head содержит ровно len узлов и заканчивается на tail,
+        контрольные узлы и словарь значений соответствуют узлам. Проверка идёт за один проход, O(n),
+        и не запоминает пройденные узлы, поэтому цикл в цепочке тоже обнаруживается: после len узлов
+        цепочка не закончится.
+        :raises ValueError: Если найдено несоответствие
+        """
+        if (self.head is None) != (self.len == 0) or (self.tail is None) != (self.len == 0):
+            raise ValueError(f"head и tail не соответствуют длине списка len={self.len}")
+
+        checkpoint_position = 0
+        unhashable_count = 0
+        last_node = None
+        current = self.head
+        for index in range(self.len):
+            if current is None:
+                raise ValueError(f"Цепочка закончилась после {index} узлов, а len={self.len}")
+
+            if (checkpoint_position < len(self.checkpoint_indexes)
+                    and self.checkpoint_indexes[checkpoint_position] == index):
+                if self.checkpoint_nodes[checkpoint_position] is not current:
+                    raise ValueError(f"Контрольный узел с индексом {index} не совпадает с узлом списка")
+                checkpoint_position += 1
+
+            if self.hashed:
+                try:
+                    nodes = self.value_nodes.get(current.value)
+                except TypeError:
+                    unhashable_count += 1
+                else:
+                    if nodes is None or current not in nodes:
+                        raise ValueError(f"Узла с индексом {index} нет в словаре значений")
+
+            last_node = current
+            current = current.next
+
+        if last_node is not self.tail:
+            raise ValueError("tail не указывает на последний узел цепочки")
+        if current is not None:
+            raise ValueError("После tail цепочка продолжается, возможно, в ней есть цикл")
+        if checkpoint_position != len(self.checkpoint_indexes):
+            raise ValueError("Контрольные индексы не по возрастанию или выходят за пределы списка")
+        if self.hashed:
+            indexed_count = sum(len(nodes) for nodes in self.value_nodes.values())
+            if unhashable_count != self.unhashable_count or indexed_count + unhashable_count != self.len:
+                raise ValueError("В словаре значений лишние узлы")
+
+    def __len__(self):
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __len__")
+        return self.len
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """ Метод возвращает значение узла по указанному индексу или новый LinkedList по срезу. """
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __getitem__, запросили index={index}")
+        if isinstance(index, slice):
+            return self.get_slice(index)
+        node = self.step_by_step_on_nodes(index)
+        return node.value
+
+    def __setitem__(self, key: Union[int, slice], value: Any):
+        """ Метод устанавливает значение узла по указанному индексу или значения из итерируемого объекта по срезу. """
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __setitem__, запросили изменение на позиции key={key} со значением value={value}")
+        if isinstance(key, slice):
+            self.set_slice(key, value)
+            return
+        node = self.step_by_step_on_nodes(key)
+        if self.hashed:
+            self.remove_value_node(node)
+            node.value = value
+            self.add_value_node(node)
+        else:
+            node.value = value
+
+    def __delitem__(self, key: Union[int, slice]):
+        """ Метод удаляет значение узла по указанному индексу или все значения по срезу. В качестве следующего элемента
+        ставится тот, что был за удаляемым.
+        """
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __delitem__, запросили удаление на позиции key={key}")
+        if isinstance(key, slice):
+            self.delete_slice(key)
+            return
+        self.pop(key)
+
+    def slice_indexes(self, key: slice) -> tuple[range, range]:
+        """
+        Переводит срез в индексы по правилам list.
+        :return: Индексы в порядке среза и те же индексы по возрастанию, в этом порядке их проходит односвязный список
+        """
+        indexes = range(*key.indices(self.len))
+        return indexes, indexes if indexes.step > 0 else indexes[::-1]
+
+    def get_slice(self, key: slice) -> 'LinkedList':
+        """
+        Возвращает новый LinkedList со значениями по срезу за один проход по узлам.
+        При отрицательном шаге узлы всё равно проходятся от головы, а новые узлы добавляются в начало копии.
+        """
+        indexes, ascending = self.slice_indexes(key)
+        make_node = Node if self.node_pool is None else self.node_pool.acquire
+        head = None
+        tail = None
+        if ascending:
+            current = self.step_by_step_on_nodes(ascending[0])
+            for offset in range(ascending[-1] - ascending[0] + 1):
+                if offset % ascending.step == 0:
+                    new_node = make_node(current.value)
+                    if tail is None:
+                        head = tail = new_node
+                    elif indexes.step > 0:
+                        tail.next = new_node
+                        tail = new_node
+                    else:
+                        new_node.next = head
+                        head = new_node
+                current = current.next
+
+        return LinkedList.from_chain(head, tail, len(indexes), self.indexed, self.hashed)
+
+    def set_slice(self, key: slice, iterable: Iterable[Any]) -> None:
+        """
+        Присваивает значения по срезу за один проход по узлам.
+        Срез с шагом 1 заменяется цепочкой новых узлов любой длины, как у list.
+        Срезу с другим шагом нужно ровно столько значений, сколько в нём элементов, значения записываются в узлы.
+        """
+        indexes, ascending = self.slice_indexes(key)
+        if indexes.step == 1:
+            self.replace_range(indexes.start, max(indexes.start, indexes.stop), iterable)
+            return
+
+        values = list(iterable)
+        if len(values) != len(indexes):
+            raise ValueError(f"Нельзя присвоить {len(values)} значений срезу с шагом из {len(indexes)} элементов")
+        if not values:
+            return
+        if indexes.step < 0:
+            values.reverse()
+
+        current = self.step_by_step_on_nodes(ascending[0])
+        values_iterator = iter(values)
+        for offset in range(ascending[-1] - ascending[0] + 1):
+            if offset % ascending.step == 0:
+                if self.hashed:
+                    self.remove_value_node(current)
+                current.value = next(values_iterator)
+                if self.hashed:
+                    self.add_value_node(current)
+            current = current.next
+
+    def replace_range(self, start: int, stop: int, iterable: Iterable[Any]) -> None:
+        """Заменяет узлы с индексами от start до stop (не включая) на узлы со значениями из iterable."""
+        # Новые узлы связываются заранее в отдельную цепочку, поэтому iterable может быть и самим списком
+        chain = LinkedList(iterable)
+
+        prev_node = None if start == 0 else self.step_by_step_on_nodes(start - 1)
+        current = self.head if prev_node is None else prev_node.next
+        for _ in range(stop - start):
+            removed_node = current
+            current = current.next
+            if self.hashed:
+                self.remove_value_node(removed_node)
+            if self.node_pool is not None:
+                self.node_pool.release(removed_node)
+
+        # current - первый узел после заменяемого отрезка или None
+        first_node = current if chain.head is None else chain.head
+        if prev_node is None:
+            self.head = first_node
+        else:
+            prev_node.next = first_node
+        if chain.tail is not None:
+            chain.tail.next = current
+        if current is None:
+            self.tail = prev_node if chain.tail is None else chain.tail
+
+        self.len += chain.len - (stop - start)
+        self.reset_checkpoints()
+        if self.hashed:
+            new_node = chain.head
+            for _ in range(chain.len):
+                self.add_value_node(new_node)
+                new_node = new_node.next
+
+    def delete_slice(self, key: slice) -> None:
+        """Удаляет узлы по срезу за один проход по узлам."""
+        _, ascending = self.slice_indexes(key)
+        if not ascending:
+            return
+
+        prev_node = None if ascending[0] == 0 else self.step_by_step_on_nodes(ascending[0] - 1)
+        current = self.head if prev_node is None else prev_node.next
+        for offset in range(ascending[-1] - ascending[0] + 1):
+            next_node = current.next
+            if offset % ascending.step == 0:
+                # Отвязываем узел, prev_node остаётся прежним
+                if prev_node is None:
+                    self.head = next_node
+                else:
+                    prev_node.next = next_node
+                if self.hashed:
+                    self.remove_value_node(current)
+                if self.node_pool is not None:
+                    self.node_pool.release(current)
+            else:
+                prev_node = current
+            current = next_node
+
+        if current is None:
+            self.tail = prev_node  # Удалили последний узел
+        self.len -= len(ascending)
+        self.reset_checkpoints()
+
+    def __contains__(self, value: Any) -> bool:
+        """Метод для поддержки оператора in."""
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __contains__, запросили сравнение с value={value}")
+
+        count = self.hashed_count(value)
+        if count is not None:
+            return count > 0
+
+        current = self.head
+        while current is not None:
+            if current.value == value:
+                return True
+            current = current.next
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        """Создаёт новый итератор по списку и возвращает его."""
+        if self.tracer is None:
+            return self.iter_values()  # Без отладочного вывода достаточно генератора
+        self.tracer("Вызов метода __iter__")
+        return LinkedListIterator(self.head, self.tracer)
+
+    def iter_values(self) -> Iterator[Any]:
+        """Генератор значений узлов без отладочного вывода, для проходов по списку внутри методов."""
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def __bool__(self) -> bool:
+        """Возвращает True, если список непустой, и False, если пустой."""
+        if self.tracer is not None:
+            self.tracer("Вызов метода __bool__")
+        return self.head is not None
+
+    def insert(self, index: int, value: Any) -> None:
+        """Вставляет новый узел с заданным значением в указанную позицию списка."""
+        if index < 0:
+            index = 0
+        elif index > self.len:
+            index = self.len
+
+        if index == self.len:
+            # Вставка в конец списка через tail, без прохода по узлам
+            self.append(value)
+            return
+
+        new_node = Node(value) if self.node_pool is None else self.node_pool.acquire(value)
+
+        if index == 0:
+            # Вставка в начало списка
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            # Вставка в середину списка
+            prev_node = self.step_by_step_on_nodes(index - 1)
+            new_node.next = prev_node.next
+            prev_node.next = new_node
+
+        self.len += 1
+        if self.hashed:
+            self.add_value_node(new_node)
+        if self.indexed and self.checkpoint_nodes:
+            self.shift_checkpoints(index)
+
+    def index(self, value: Any) -> int:
+        """
+        Возвращает индекс первого узла со значением, равным value.
+        В режиме hashed отсутствие значения определяется по словарю значений, без прохода по списку.
+        """
+        if self.hashed_count(value) == 0:
+            raise ValueError(f"{value} не содержится в списке")
+
+        current = self.head
+        for i in range(self.len):
+            if current.value == value:
+                return i
+            current = current.next
+        raise ValueError(f"{value} не содержится в списке")
+
+    def count(self, value: Any) -> int:
+        """Возвращает количество узлов со значением, равным value. В режиме hashed - за O(1) в среднем."""
+        count = self.hashed_count(value)
+        if count is not None:
+            return count
+
+        current = self.head
+        count = 0
+        while current is not None:
+            if current.value == value:
+                count += 1
+            current = current.next
+        return count
+
+    def pop(self, index: int = None) -> Any:
+        """
+        Удаляет и возвращает узел по указанному индексу.
+        Если индекс не указан, удаляет и возвращает последний элемент.
+        """
+        if index is None:
+            index = self.len - 1  # Удаляем последний элемент
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+        if not 0 <= index < self.len:
+            raise IndexError('Выход за допустимые границы')
+
+        if index == 0:
+            # Удаление первого узла
+            removed_node = self.head
+            self.head = removed_node.next
+            if self.head is None:
+                self.tail = None  # Список опустел
+        else:
+            # Удаление узла из середины или конца списка
+            prev_node = self.step_by_step_on_nodes(index - 1)
+            removed_node = prev_node.next
+            prev_node.next = removed_node.next
+            if prev_node.next is None:
+                self.tail = prev_node  # Удалили последний узел
+
+        self.len -= 1
+        if self.indexed and self.checkpoint_nodes:
+            self.unshift_checkpoints(index, removed_node)
+        if self.hashed:
+            self.remove_value_node(removed_node)
+
+        if self.node_pool is None:
+            return removed_node.value
+        value = removed_node.value
+        self.node_pool.release(removed_node)  # Ссылки узла понадобились выше, поэтому в пул он попадает последним
+        return value
+
+    def __add__(self, other: Any) -> 'LinkedList':
+        """
+        Метод добавляет либо отдельный узел (Node), либо другой связанный список (LinkedList)
+        в конец текущего связного списка.
+        """
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __add__, запросили добавление other={other}")
+        if isinstance(other, Node):
+            self.append(other.value)
+        elif isinstance(other, LinkedList):
+            self.extend(other.iter_values())
+        else:
+            raise TypeError("Можно добавлять только Node или LinkedList.")
+
+        return self
+
+    def __iadd__(self, other: Any) -> 'LinkedList':
+        """
+        Оператор +=. Другой LinkedList присоединяется за O(1) методом splice и становится пустым.
+        Узел Node добавляется как значение, как в __add__.
+        """
+        if isinstance(other, LinkedList) and other is not self:
+            self.splice(other)
+            return self
+        return self + other
+
+    def __sub__(self, node: Node) -> 'LinkedList':
+        """
+        Метод удаляет указанный узел (Node) из связанного списка, если он существует.
+        В режиме hashed отсутствующее значение обнаруживается за O(1). Найденный узел всё равно
+        приходится искать проходом от головы: без ссылки на предыдущий узел его не отвязать.
+        :raises TypeError: Если передан не Node
+        """
+        if self.tracer is not None:
+            self.tracer(f"Вызов метода __sub__, запросили удаление node={node}")
+        if not isinstance(node, Node):
+            raise TypeError(f"Можно удалять только Node, получен {type(node).__name__}")
+        if self.hashed_count(node.value) == 0:
+            raise ValueError(f"Node со значением {node.value} не найдена в списке.")
+
+        current = self.head
+        prev = None
+        index = 0
+
+        while current is not None:
+            if current.value == node.value:
+                if prev is None:
+                    # Удаляемый узел - голова списка
+                    self.head = current.next
+                else:
+                    prev.next = current.next
+                if current is self.tail:
+                    # Удаляемый узел - хвост списка
+                    self.tail = prev
+                self.len -= 1
+                if self.indexed and self.checkpoint_nodes:
+                    self.unshift_checkpoints(index, current)
+                if self.hashed:
+                    self.remove_value_node(current)
+                if self.node_pool is not None:
+                    self.node_pool.release(current)
+                return self
+            prev = current
+            current = current.next
+            index += 1
+
+        raise ValueError(f"Node со значением {node.value} не найдена в списке.")
+
+    @staticmethod
+    def cut_after(node: Optional[Node], count: int) -> Optional[Node]:
+        """
+        Отрезает цепочку после count узлов, начиная с node.
+        :return: Первый узел оставшейся части цепочки или None
+        """
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next
+        if node is None:
+            return None
+        rest = node.next
+        node.next = None
+        return rest
+
+    @staticmethod
+    def merge_chains(tail: Node, left: Optional[Node], right: Optional[Node], keyed: bool, reverse: bool) -> Node:
+        """
+        Сливает две отсортированные цепочки, пристраивая узлы после узла tail.
+        При равных ключах первым идёт узел из левой цепочки, поэтому сортировка устойчива.
+        Если сравнение выбросит исключение, оставшиеся узлы обеих цепочек всё равно пристраиваются после tail,
+        поэтому ни один узел не теряется.
+        :param keyed: В узлах временно лежат пары (ключ, значение), сравниваются ключи
+        :return: Последний узел получившейся цепочки
+        """
+        try:
+            while left is not None and right is not None:
+                left_key = left.value[0] if keyed else left.value
+                right_key = right.value[0] if keyed else right.value
+                take_right = left_key < right_key if reverse else right_key < left_key
+                if take_right:
+                    tail.next = right
+                    right = right.next
+                else:
+                    tail.next = left
+                    left = left.next
+                tail = tail.next
+        finally:
+            # Обычно одна из цепочек уже закончилась, но после исключения пристраиваются остатки обеих
+            for rest in (left, right):
+                tail.next = rest
+                while tail.next is not None:
+                    tail = tail.next
+        return tail
+
+    def sort(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        Устойчиво сортирует список на месте восходящей сортировкой слиянием за O(n log n).
+        Узлы не копируются, а перевязываются. Без key дополнительная память O(1), с key - O(n):
+        как и у list.sort, key вызывается ровно один раз для каждого значения, а на время сортировки
+        в узлах лежат пары (ключ, значение).
+        Если key или сравнение выбросят исключение (например, TypeError при сравнении числа со строкой),
+        исключение передаётся дальше, а список остаётся целым: все значения на месте, но, как и у list.sort,
+        их порядок может оказаться частично изменённым.
+        Слияние написано на Python, поэтому на 10^4-10^6 случайных чисел сама сортировка примерно в 10 раз
+        (в замерах 8-14) медленнее, чем sorted() по значениям с записью их обратно в узлы, а с key - до 20 раз
+        (benchmarks/bench_sort.py).
+        Выигрыш sort - в памяти: без key она не создаёт копию значений.
+        :param key: Функция, вычисляющая ключ сравнения для значения, как у list.sort
+        :param reverse: Сортировать по убыванию
+        """
+        keyed = key is not None
+        if keyed:
+            keys = [key(value) for value in self.iter_values()]  # Если key выбросит исключение, список ещё не изменён
+            node = self.head
+            for value_key in keys:
+                node.value = (value_key, node.value)
+                node = node.next
+            del keys
+
+        dummy = Node(None)  # Фиктивный узел, к которому пристраиваются слитые отрезки
+        tail = dummy
+        remaining = None
+        width = 1
+        try:
+            while width < self.len:
+                # За один проход сливаем соседние отсортированные отрезки длины width
+                remaining = self.head
+                tail = dummy
+                while remaining is not None:
+                    left = remaining
+                    right = self.cut_after(left, width)
+                    remaining = self.cut_after(right, width)
+                    tail = self.merge_chains(tail, left, right, keyed, reverse)
+
+                self.head = dummy.next
+                self.tail = tail
+                width *= 2
+        except BaseException:
+            # merge_chains уже пристроил после tail свои узлы, возвращаем в список и ещё не слитые отрезки
+            while tail.next is not None:
+                tail = tail.next
+            tail.next = remaining
+            while tail.next is not None:
+                tail = tail.next
+            self.head = dummy.next
+            self.tail = tail
+            raise
+        finally:
+            if keyed:
+                node = self.head
+                while node is not None:
+                    node.value = node.value[1]
+                    node = node.next
+            self.reset_checkpoints()  # Узлы поменяли позиции, контрольные узлы устарели
+
+    def sorted_copy(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> 'LinkedList':
+        """
+        Возвращает новый отсортированный связный список, исходный список не меняется.
+        Копия всё равно занимает O(n) памяти, поэтому значения сортируются встроенной sorted(),
+        она работает быстрее сортировки слиянием на Python.
+        """
+        return LinkedList(sorted(self.iter_values(), key=key, reverse=reverse),
+                          indexed=self.indexed, hashed=self.hashed)
+
+    def map_inplace(self, function: Callable[[Any], Any]) -> None:
+        """
+        Заменяет каждое значение на function(value) за один проход по узлам.
+        Узлы остаются прежними, поэтому контрольные узлы не устаревают, а в режиме hashed
+        словарь значений обновляется для каждого узла.
+        """
+        current = self.head
+        if self.hashed:
+            while current is not None:
+                self.remove_value_node(current)
+                current.value = function(current.value)
+                self.add_value_node(current)
+                current = current.next
+            return
+
+        while current is not None:
+            current.value = function(current.value)
+            current = current.next
+
+    def filter_inplace(self, predicate: Callable[[Any], Any]) -> None:
+        """
+        Оставляет в списке только значения, для которых predicate(value) истинно, за один проход по узлам.
+        Длина, tail и словарь значений обновляются сразу при удалении узла, поэтому если predicate
+        выбросит исключение, список останется согласованным.
+        """
+        self.reset_checkpoints()  # Позиции узлов поменяются, контрольные узлы построятся заново при обращении
+        prev_node = None
+        current = self.head
+        while current is not None:
+            next_node = current.next
+            if predicate(current.value):
+                prev_node = current
+            else:
+                if prev_node is None:
+                    self.head = next_node
+                else:
+                    prev_node.next = next_node
+                if current is self.tail:
+                    self.tail = prev_node
+                self.len -= 1
+                if self.hashed:
+                    self.remove_value_node(current)
+                if self.node_pool is not None:
+                    self.node_pool.release(current)
+            current = next_node
+
+    def sum(self, start: Any = 0) -> Any:
+        """Сумма значений списка, как sum(ll, start), но без вызовов __iter__ и отладочного вывода."""
+        return sum(self.iter_values(), start)
+
+    def min(self, key: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Наименьшее значение списка. Для пустого списка выбрасывает ValueError."""
+        if self.head is None:
+            raise ValueError("Список пуст")
+        return min(self.iter_values(), key=key)
+
+    def max(self, key: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Наибольшее значение списка. Для пустого списка выбрасывает ValueError."""
+        if self.head is None:
+            raise ValueError("Список пуст")
+        return max(self.iter_values(), key=key)
+
+    def to_numpy(self, dtype: Any = None) -> 'numpy.ndarray':
+        """
+        Копирует значения в массив NumPy за один проход по узлам.
+        :param dtype: Тип элементов массива. Если не указан, выбирается по numeric_typecode: int64 или float64,
+                      для пустого списка - float64
+        """
+        if numpy is None:
+            raise ImportError("Для этого метода нужен NumPy: pip install numpy")
+        if dtype is None:
+            dtype = self.numeric_typecode() if self.head is not None else 'd'
+            if dtype is None:
+                raise TypeError("Значения списка должны быть целыми 64-битными или вещественными числами")
+        return numpy.fromiter(self.iter_values(), dtype=dtype, count=self.len)
+
+    def map_vectorized(self, function: Callable[['numpy.ndarray'], 'numpy.ndarray'], dtype: Any = None) -> None:
+        """
+        Векторный вариант map_inplace для числовых списков: значения копируются в массив NumPy,
+        function вычисляет новый массив целиком, например lambda values: values * 2 + 1,
+        и результат записывается обратно в узлы вторым проходом.
+        Вместо вызова Python-функции на каждое значение выполняется одна операция над массивом.
+        """
+        result = function(self.to_numpy(dtype))
+        if len(result) != self.len:
+            raise ValueError(f"Функция вернула {len(result)} значений, а в списке {self.len}")
+
+        values = result.tolist()  # tolist превращает элементы массива в обычные int и float
+        if self.hashed:
+            values = iter(values)
+            self.map_inplace(lambda _: next(values))
+            return
+
+        current = self.head
+        for value in values:
+            current.value = value
+            current = current.next
+
+    def filter_vectorized(self, predicate: Callable[['numpy.ndarray'], 'numpy.ndarray'], dtype: Any = None) -> None:
+        """
+        Векторный вариант filter_inplace: predicate получает массив значений и возвращает массив
+        логических значений той же длины, например lambda values: values > 0.
+        """
+        mask = predicate(self.to_numpy(dtype))
+        if len(mask) != self.len:
+            raise ValueError(f"Функция вернула {len(mask)} значений, а в списке {self.len}")
+
+        keep = iter(mask.tolist())
+        self.filter_inplace(lambda _: next(keep))
+
+    def numeric_typecode(self) -> Optional[str]:
+        """
+        Возвращает код типа array, в который значения списка помещаются без потерь:
+        'q' для целых чисел в пределах 64 бит, 'd' для вещественных чисел, иначе None.
+        """
+        value_types = set(map(type, self.iter_values()))
+        if value_types == {float}:
+            return 'd'
+        if value_types == {int} and -2 ** 63 <= min(self.iter_values()) and max(self.iter_values()) < 2 ** 63:
+            return 'q'
+        return None
+
+    def to_bytes(self) -> bytes:
+        """
+        Сохраняет список в байты через pickle (протокол 5).
+        Числовые значения упаковываются в array и передаются отдельным буфером вне потока pickle,
+        поэтому не копируются лишний раз. Формат: длина заголовка pickle (8 байт), заголовок, буфер значений.
+        Буфер записывается в порядке байтов этой машины, порядок сохраняется в заголовке.
+        """
+        typecode = self.numeric_typecode()
+        if typecode is None:
+            values = list(self.iter_values())
+        else:
+            values = pickle.PickleBuffer(array(typecode, self.iter_values()))
+
+        buffers = []
+        header = pickle.dumps({"indexed": self.indexed, "hashed": self.hashed, "typecode": typecode,
+                               "byteorder": sys.byteorder, "values": values},
+                              protocol=5, buffer_callback=buffers.append)
+        return b"".join([struct.pack("<Q", len(header)), header, *(buffer.raw() for buffer in buffers)])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'LinkedList':
+        """
+        Восстанавливает список из байтов, полученных методом to_bytes.
+        Если байты записаны на машине с другим порядком байтов, числа в буфере переставляются через byteswap.
+        """
+        view = memoryview(data)
+        header_end = 8 + struct.unpack_from("<Q", view)[0]
+        state = pickle.loads(view[8:header_end], buffers=[view[header_end:]])
+
+        values = state["values"]
+        if state["typecode"] is not None:
+            buffer = values
+            values = array(state["typecode"])
+            values.frombytes(buffer)
+            if state.get("byteorder", sys.byteorder) != sys.byteorder:
+                values.byteswap()
+        return cls(values, indexed=state["indexed"], hashed=state["hashed"])
+
+    def extra_state(self) -> dict[str, Any]:
+        """
+        Атрибуты экземпляра, которые не создаёт конструктор LinkedList, например атрибуты подкласса.
+        Узлы и служебные структуры списка сюда не входят, их копии строятся заново.
+        """
+        own_attributes = vars(LinkedList())
+        return {name: value for name, value in vars(self).items() if name not in own_attributes}
+
+    def __reduce__(self) -> tuple:
+        """
+        Поддержка pickle.dumps(ll). Без этого метода pickle сохраняет узлы рекурсивно,
+        по узлу на уровень вложенности, и на длинных списках выходит за предел глубины рекурсии.
+        Атрибуты подкласса передаются третьим элементом, pickle восстанавливает их в __dict__.
+        """
+        return type(self).from_bytes, (self.to_bytes(),), self.extra_state() or None
+
+    def __copy__(self) -> 'LinkedList':
+        """Поверхностная копия для copy.copy(ll): значения не сохраняются через pickle, а переносятся как есть."""
+        result = type(self)(self.iter_values(), indexed=self.indexed, hashed=self.hashed)
+        result.__dict__.update(self.extra_state())
+        return result
+
+    def __deepcopy__(self, memo: dict) -> 'LinkedList':
+        """
+        Глубокая копия для copy.deepcopy(ll). Значения копируются по одному через copy.deepcopy, а не через pickle,
+        поэтому копируются и значения, которые pickle сохранить не может, например lambda-функции.
+        Копия записывается в memo до копирования значений, чтобы список, содержащий сам себя, копировался верно.
+        """
+        result = type(self)(indexed=self.indexed, hashed=self.hashed)
+        memo[id(self)] = result
+        result.extend(copy.deepcopy(value, memo) for value in self.iter_values())
+        result.__dict__.update(copy.deepcopy(self.extra_state(), memo))
+        return result
+
+    def to_jsonl(self, fp: TextIO) -> None:
+        """Записывает значения в текстовый файл fp по одному JSON-значению на строку."""
+        dumps = json.dumps
+        for value in self.iter_values():
+            fp.write(dumps(value))
+            fp.write("\n")
+
+    @classmethod
+    def from_jsonl(cls, fp: TextIO, indexed: bool = False, hashed: bool = False) -> 'LinkedList':
+        """
+        Создаёт список из текстового файла, записанного методом to_jsonl.
+        Строки читаются по одной и сразу превращаются в узлы, промежуточный list не создаётся.
+        """
+        loads = json.loads
+        return cls((loads(line) for line in fp if not line.isspace()), indexed=indexed, hashed=hashed)
+
+
+if __name__ == "__main__":
+    LinkedList.set_tracer(print)  # Показываем, какие методы вызываются
+
+    ll = LinkedList(range(10), indexed=True)
+    print("Исходный список:", ll)
+
+    print(ll[7])
+    ll[3] = 30
+    ll.insert(0, -1)
+    ll.insert(5, 50)
+    print("После изменений:", ll)
+
+    print("Удалили:", ll.pop(6))
+    del ll[0]
+    print("После удалений:", ll)
+    print("Контрольные узлы:", ll.checkpoint_indexes)
+
+    ll.set_indexed(False)
+    print(ll[7])
+    print("Каждый второй элемент:", ll[::2])
+    del ll[1:4]
+    print("После удаления среза:", ll)
+
+    letters = LinkedList("абракадабра", hashed=True)
+    print("Сколько раз встречается 'а':", letters.count("а"))
+    print("'я' в списке:", "я" in letters)
+
+    numbers = LinkedList(range(10))
+    numbers.filter_inplace(lambda value: value % 3 == 0)
+    numbers.map_inplace(lambda value: value * value)
+    print("Квадраты чисел, кратных 3:", numbers, "сумма", numbers.sum(), "наибольшее", numbers.max())
+
+    counter = MethodCallCounter()
+    LinkedList.set_tracer(counter)
+    sorted(ll)
+    print("Вызовы методов при sorted:", dict(counter.counts))
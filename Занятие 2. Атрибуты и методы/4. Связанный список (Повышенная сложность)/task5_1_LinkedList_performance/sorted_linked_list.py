@@ -0,0 +1,210 @@
+from random import random
+from typing import Iterable, Iterator, Optional, Any
+
+MAX_LEVEL = 32  # Максимальное число уровней, хватает для списков из 2**32 значений
+PROMOTION_PROBABILITY = 0.5  # Вероятность того, что узел попадёт на следующий уровень
+
+
+class SkipNode:
+    """
+    Узел списка с пропусками. В отличие от Node, у него не одна ссылка next, а по ссылке на каждый уровень.
+    width[level] - сколько узлов нижнего уровня перешагивает ссылка next[level], она нужна для доступа по индексу.
+    """
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Any, level: int):
+        self.value = value
+        self.next: list[Optional["SkipNode"]] = [None] * level
+        self.width: list[int] = [1] * level
+
+    def __repr__(self) -> str:
+        return f"SkipNode({self.value}, level={len(self.next)})"
+
+
+class SortedLinkedList:
+    """
+    Отсортированный связный список на основе списка с пропусками (skip list).
+
+    Нижний уровень - обычный односвязный список всех значений по возрастанию. На каждом следующем уровне
+    остаётся примерно половина узлов предыдущего, поэтому поиск начинается с верхнего уровня длинными прыжками
+    и спускается вниз. Добавление, удаление, поиск и доступ по индексу стоят O(log n) в среднем.
+    """
+
+    def __init__(self, data: Iterable = None):
+        """
+        Конструктор отсортированного списка
+        :param data: Итерируемый объект с начальными значениями в любом порядке
+        """
+        self.head = SkipNode(None, MAX_LEVEL)  # Фиктивный узел перед первым значением на всех уровнях
+        self.level = 1  # Сколько уровней сейчас используется
+        self.len = 0
+
+        if data is not None:
+            for value in data:
+                self.add(value)
+
+    @staticmethod
+    def random_level() -> int:
+        """Случайное число уровней для нового узла: 1 с вероятностью 1/2, 2 - с вероятностью 1/4 и так далее."""
+        level = 1
+        while level < MAX_LEVEL and random() < PROMOTION_PROBABILITY:
+            level += 1
+        return level
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __bool__(self) -> bool:
+        return self.len > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Перебирает значения по возрастанию по нижнему уровню."""
+        current = self.head.next[0]
+        while current is not None:
+            yield current.value
+            current = current.next[0]
+
+    def __repr__(self) -> str:
+        return f"SortedLinkedList({' -> '.join(str(value) for value in self)})"
+
+    def add(self, value: Any) -> None:
+        """Добавляет значение, сохраняя порядок. Равные значения добавляются после уже имеющихся."""
+        update = [self.head] * MAX_LEVEL  # Последний узел перед местом вставки на каждом уровне
+        rank = [0] * MAX_LEVEL  # Позиция этого узла в нижнем уровне, у head позиция 0
+
+        current = self.head
+        position = 0
+        for level in reversed(range(self.level)):
+            while current.next[level] is not None and current.next[level].value <= value:
+                position += current.width[level]
+                current = current.next[level]
+            update[level] = current
+            rank[level] = position
+
+        new_level = self.random_level()
+        if new_level > self.level:
+            for level in range(self.level, new_level):
+                self.head.width[level] = self.len + 1  # Ссылка в пустоту перешагивает все узлы
+            self.level = new_level
+
+        new_node = SkipNode(value, new_level)
+        for level in range(new_level):
+            prev_node = update[level]
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+            # Новый узел делит прыжок prev_node на две части
+            new_node.width[level] = prev_node.width[level] - (position - rank[level])
+            prev_node.width[level] = position - rank[level] + 1
+
+        for level in range(new_level, self.level):
+            update[level].width[level] += 1  # Ссылки выше нового узла теперь перешагивают на один узел больше
+
+        self.len += 1
+
+    def find_before(self, value: Any) -> tuple[list[SkipNode], int]:
+        """
+        Находит на каждом уровне последний узел со значением меньше value.
+        :return: Эти узлы по уровням и число значений меньше value
+        """
+        update = [self.head] * MAX_LEVEL
+        current = self.head
+        position = 0
+        for level in reversed(range(self.level)):
+            while current.next[level] is not None and current.next[level].value < value:
+                position += current.width[level]
+                current = current.next[level]
+            update[level] = current
+        return update, position
+
+    def remove(self, value: Any) -> None:
+        """Удаляет первое значение, равное value."""
+        update, _ = self.find_before(value)
+        target = update[0].next[0]
+        if target is None or target.value != value:
+            raise ValueError(f"{value} не содержится в списке")
+
+        for level in range(self.level):
+            prev_node = update[level]
+            if prev_node.next[level] is target:
+                prev_node.width[level] += target.width[level] - 1
+                prev_node.next[level] = target.next[level]
+            else:
+                prev_node.width[level] -= 1
+
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.len -= 1
+
+    def discard(self, value: Any) -> None:
+        """Удаляет первое значение, равное value, если оно есть."""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def __contains__(self, value: Any) -> bool:
+        update, _ = self.find_before(value)
+        candidate = update[0].next[0]
+        return candidate is not None and candidate.value == value
+
+    def bisect_left(self, value: Any) -> int:
+        """Индекс, на который встало бы value перед равными ему значениями (как bisect.bisect_left)."""
+        return self.find_before(value)[1]
+
+    def bisect_right(self, value: Any) -> int:
+        """Индекс, на который встало бы value после равных ему значений (как bisect.bisect_right)."""
+        current = self.head
+        position = 0
+        for level in reversed(range(self.level)):
+            while current.next[level] is not None and current.next[level].value <= value:
+                position += current.width[level]
+                current = current.next[level]
+        return position
+
+    def count(self, value: Any) -> int:
+        """Возвращает количество значений, равных value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def __getitem__(self, index: int) -> Any:
+        """Возвращает значение по индексу за O(log n), прыгая по ссылкам с известной шириной."""
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+        if index < 0:
+            index += self.len
+        if not 0 <= index < self.len:
+            raise IndexError('Выход за допустимые границы')
+
+        target_position = index + 1  # Позиции узлов считаются с 1, у head позиция 0
+        current = self.head
+        position = 0
+        for level in reversed(range(self.level)):
+            while current.next[level] is not None and position + current.width[level] <= target_position:
+                position += current.width[level]
+                current = current.next[level]
+        return current.value
+
+    def irange(self, minimum: Any = None, maximum: Any = None) -> Iterator[Any]:
+        """
+        Перебирает значения от minimum до maximum включительно.
+        Начало диапазона находится за O(log n), дальше значения перебираются по нижнему уровню.
+        :param minimum: Нижняя граница или None, если её нет
+        :param maximum: Верхняя граница или None, если её нет
+        """
+        if minimum is None:
+            current = self.head.next[0]
+        else:
+            current = self.find_before(minimum)[0][0].next[0]
+
+        while current is not None and (maximum is None or current.value <= maximum):
+            yield current.value
+            current = current.next[0]
+
+
+if __name__ == "__main__":
+    sll = SortedLinkedList([5, 1, 4, 2, 3, 2])
+    print(sll)  # SortedLinkedList(1 -> 2 -> 2 -> 3 -> 4 -> 5)
+    sll.add(0)
+    sll.remove(4)
+    print(list(sll), len(sll), 3 in sll, 4 in sll)  # [0, 1, 2, 2, 3, 5] 6 True False
+    print(sll[2], sll.bisect_left(2), sll.bisect_right(2), sll.count(2))  # 2 2 4 2
+    print(list(sll.irange(2, 4)))  # [2, 2, 3]
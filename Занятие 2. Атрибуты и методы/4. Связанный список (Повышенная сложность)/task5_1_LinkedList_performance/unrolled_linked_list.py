@@ -0,0 +1,240 @@
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Any
+
+from node import Node
+
+
+class Block:
+    """ Узел развёрнутого связного списка, который хранит сразу несколько значений. """
+    __slots__ = ("values", "next")
+
+    def __init__(self, values: Optional[list] = None):
+        self.values: list = [] if values is None else values  # Значения блока, не больше capacity штук
+        self.next: Optional["Block"] = None
+
+    def __repr__(self) -> str:
+        return f"Block({self.values})"
+
+
+class UnrolledLinkedList:
+    """
+    Развёрнутый связный список: каждый узел (Block) хранит небольшой массив значений.
+    Ссылок на один элемент приходится в capacity раз меньше, а значения внутри блока
+    лежат подряд, поэтому перебор и хранение обходятся дешевле, чем у LinkedList.
+    """
+
+    def __init__(self, data: Iterable = None, capacity: int = 64):
+        """
+        Конструктор развёрнутого связного списка
+        :param data: Итерируемый объект с начальными значениями
+        :param capacity: Максимальное число значений в одном блоке
+        """
+        if capacity < 2:
+            raise ValueError('Вместимость блока должна быть не меньше 2')
+
+        self.capacity = capacity
+        self.len = 0
+        self.head: Optional[Block] = None
+        self.tail: Optional[Block] = None
+
+        if data is not None:
+            self.extend(data)
+
+    def step_by_step_on_blocks(self, index: int) -> tuple[Optional[Block], Block, int]:
+        """
+        Функция выполняет перемещение по блокам до блока с указанным индексом.
+        :return: Предыдущий блок (или None), блок с элементом и позиция элемента внутри блока
+        """
+        if not isinstance(index, int):
+            raise TypeError('Индекс должен быть целым')
+
+        if not 0 <= index < self.len:
+            raise IndexError('Выход за допустимые границы')
+
+        prev_block = None
+        current_block = self.head
+        while index >= len(current_block.values):
+            index -= len(current_block.values)
+            prev_block = current_block
+            current_block = current_block.next
+
+        return prev_block, current_block, index
+
+    def append_block(self, block: Block) -> None:
+        """Присоединяет блок в конец списка."""
+        if self.head is None:
+            self.head = block
+        else:
+            self.tail.next = block
+        self.tail = block
+
+    def remove_block(self, prev_block: Optional[Block], block: Block) -> None:
+        """Убирает блок из цепочки блоков."""
+        if prev_block is None:
+            self.head = block.next
+        else:
+            prev_block.next = block.next
+        if block is self.tail:
+            self.tail = prev_block
+
+    def append(self, value: Any) -> None:
+        """
+        Добавляет значение в конец списка.
+        :param value: Значение для добавления.
+        """
+        if self.tail is None or len(self.tail.values) >= self.capacity:
+            self.append_block(Block())
+        self.tail.values.append(value)
+        self.len += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Добавляет несколько значений в конец списка из итерируемого объекта.
+        :param iterable: Итерируемый объект с элементами для добавления.
+        """
+        for item in iterable:
+            tail = self.tail
+            if tail is None or len(tail.values) >= self.capacity:
+                tail = Block()
+                self.append_block(tail)
+            tail.values.append(item)
+            self.len += 1
+
+    def __repr__(self) -> str:
+        """Возвращает строковое представление всего списка."""
+        return f"UnrolledLinkedList({' -> '.join(str(value) for value in self)})"
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __bool__(self) -> bool:
+        return self.len > 0
+
+    def iter_blocks(self) -> Iterator[Block]:
+        """Генератор блоков списка от головы к хвосту."""
+        current_block = self.head
+        while current_block is not None:
+            yield current_block
+            current_block = current_block.next
+
+    def __iter__(self) -> Iterator[Any]:
+        """Перебирает значения блок за блоком, внутри блока перебор идёт средствами list."""
+        return chain.from_iterable(block.values for block in self.iter_blocks())
+
+    def __contains__(self, value: Any) -> bool:
+        """Метод для поддержки оператора in."""
+        current_block = self.head
+        while current_block is not None:
+            if value in current_block.values:
+                return True
+            current_block = current_block.next
+        return False
+
+    def __getitem__(self, index: int) -> Any:
+        """ Метод возвращает значение по указанному индексу. """
+        _, block, offset = self.step_by_step_on_blocks(index)
+        return block.values[offset]
+
+    def __setitem__(self, key: int, value: Any):
+        """ Метод устанавливает значение по указанному индексу. """
+        _, block, offset = self.step_by_step_on_blocks(key)
+        block.values[offset] = value
+
+    def __delitem__(self, key: int):
+        """ Метод удаляет значение по указанному индексу. """
+        self.pop(key)
+
+    def insert(self, index: int, value: Any) -> None:
+        """Вставляет значение в указанную позицию списка."""
+        if index < 0:
+            index = 0
+        elif index > self.len:
+            index = self.len
+
+        if index == self.len:
+            self.append(value)
+            return
+
+        _, block, offset = self.step_by_step_on_blocks(index)
+        if len(block.values) >= self.capacity:
+            # Блок заполнен: переносим его вторую половину в новый блок сразу за ним
+            middle = len(block.values) // 2
+            new_block = Block(block.values[middle:])
+            del block.values[middle:]
+            new_block.next = block.next
+            block.next = new_block
+            if block is self.tail:
+                self.tail = new_block
+            if offset > middle:
+                block, offset = new_block, offset - middle
+
+        block.values.insert(offset, value)
+        self.len += 1
+
+    def index(self, value: Any) -> int:
+        """Возвращает индекс первого вхождения значения value."""
+        start = 0
+        current_block = self.head
+        while current_block is not None:
+            if value in current_block.values:
+                return start + current_block.values.index(value)
+            start += len(current_block.values)
+            current_block = current_block.next
+        raise ValueError(f"{value} не содержится в списке")
+
+    def count(self, value: Any) -> int:
+        """Возвращает количество значений, равных value."""
+        count = 0
+        current_block = self.head
+        while current_block is not None:
+            count += current_block.values.count(value)
+            current_block = current_block.next
+        return count
+
+    def pop(self, index: int = None) -> Any:
+        """
+        Удаляет и возвращает значение по указанному индексу.
+        Если индекс не указан, удаляет и возвращает последнее значение.
+        """
+        if index is None:
+            index = self.len - 1
+
+        prev_block, block, offset = self.step_by_step_on_blocks(index)
+        value = block.values.pop(offset)
+        self.len -= 1
+
+        if not block.values:
+            self.remove_block(prev_block, block)
+        elif block.next is not None and len(block.values) + len(block.next.values) <= self.capacity:
+            # Значения блока и следующего за ним помещаются в один блок (значит, хотя бы один из них заполнен
+            # не больше чем наполовину), объединяем их, чтобы не копить почти пустые блоки
+            next_block = block.next
+            block.values.extend(next_block.values)
+            self.remove_block(block, next_block)
+
+        return value
+
+    def __add__(self, other: Any) -> 'UnrolledLinkedList':
+        """
+        Метод добавляет либо отдельный узел (Node), либо другой развёрнутый список
+        в конец текущего списка.
+        """
+        if isinstance(other, Node):
+            self.append(other.value)
+        elif isinstance(other, UnrolledLinkedList):
+            self.extend(list(other))  # Копия значений нужна, если other - это сам список
+        else:
+            raise TypeError("Можно добавлять только Node или UnrolledLinkedList.")
+
+        return self
+
+    def __sub__(self, node: Node) -> 'UnrolledLinkedList':
+        """
+        Метод удаляет первое значение, равное значению узла node.
+        """
+        try:
+            self.pop(self.index(node.value))
+        except ValueError:
+            raise ValueError(f"Node со значением {node.value} не найдена в списке.") from None
+
+        return self